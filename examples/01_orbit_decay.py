@@ -11,57 +11,291 @@ how accumulated rounding errors in float calculations can lead to incorrect
 energy conservation, while Decimal maintains accuracy throughout the simulation.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Context, Decimal, ROUND_HALF_EVEN
 import math
-from typing import Tuple, List
+import warnings
+from typing import Tuple, List, Optional, Union
+
+import numpy as np
+
+
+EARTH_RADIUS_KM = 6371.0  # km
+EARTH_GM = 3.986004418e5  # km^3/s^2 (Earth's standard gravitational parameter)
+DRAG_COEFFICIENT = 1e-10  # Simplified atmospheric drag
+
+
+def _compensated_add(total: float, compensation: float, increment: float) -> Tuple[float, float]:
+    """
+    Kahan-compensated float addition.
+    
+    Args:
+        total: Running sum
+        compensation: Low-order bits lost by previous additions
+        increment: Value to add
+    
+    Returns:
+        Tuple of (new_total, new_compensation)
+    """
+    y = increment - compensation
+    t = total + y
+    return t, (t - total) - y
+
+
+def _euler_advance(distance: float, velocity: float, GM: float, drag: float,
+                   dt: float, n_steps: int) -> Tuple[float, float]:
+    """
+    Advance the float Euler integrator by n_steps without touching instance state.
+    
+    Args:
+        distance: Distance from Earth's center in kilometers
+        velocity: Velocity in kilometers per second
+        GM: Gravitational parameter in km^3/s^2
+        drag: Drag coefficient
+        dt: Time step in seconds
+        n_steps: Number of steps to take
+    
+    Returns:
+        Tuple of (distance, velocity) after n_steps
+    """
+    for _ in range(n_steps):
+        velocity += (-drag * velocity * velocity - GM / (distance * distance)) * dt
+        distance += velocity * dt
+    return distance, velocity
+
+
+def _rk4_advance(distance: float, velocity: float, GM: float, drag: float,
+                 dt: float, n_steps: int) -> Tuple[float, float]:
+    """
+    Advance with classical fourth-order Runge-Kutta by n_steps.
+    
+    Same arguments and return value as _euler_advance.
+    """
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+    for _ in range(n_steps):
+        k1d = velocity
+        k1v = -drag * velocity * velocity - GM / (distance * distance)
+        k2d = velocity + half_dt * k1v
+        r = distance + half_dt * k1d
+        k2v = -drag * k2d * k2d - GM / (r * r)
+        k3d = velocity + half_dt * k2v
+        r = distance + half_dt * k2d
+        k3v = -drag * k3d * k3d - GM / (r * r)
+        k4d = velocity + dt * k3v
+        r = distance + dt * k3d
+        k4v = -drag * k4d * k4d - GM / (r * r)
+        distance += sixth_dt * (k1d + 2 * k2d + 2 * k3d + k4d)
+        velocity += sixth_dt * (k1v + 2 * k2v + 2 * k3v + k4v)
+    return distance, velocity
+
+
+def _leapfrog_advance(distance: float, velocity: float, GM: float, drag: float,
+                      dt: float, n_steps: int) -> Tuple[float, float]:
+    """
+    Advance with kick-drift-kick leapfrog by n_steps.
+    
+    Same arguments and return value as _euler_advance.
+    """
+    half_dt = 0.5 * dt
+    for _ in range(n_steps):
+        velocity += (-drag * velocity * velocity - GM / (distance * distance)) * half_dt
+        distance += velocity * dt
+        velocity += (-drag * velocity * velocity - GM / (distance * distance)) * half_dt
+    return distance, velocity
+
+
+def _batch_euler(distance: np.ndarray, velocity: np.ndarray, GM: float, drag: float,
+                 dt: float, n_steps: int) -> None:
+    """
+    Advance N independent satellites by n_steps Euler steps, in place.
+    
+    Args:
+        distance: (N,) distances from Earth's center in kilometers
+        velocity: (N,) velocities in kilometers per second
+        GM: Gravitational parameter in km^3/s^2
+        drag: Drag coefficient
+        dt: Time step in seconds
+        n_steps: Number of steps to take
+    """
+    for _ in range(n_steps):
+        velocity += (-drag * velocity * velocity - GM / (distance * distance)) * dt
+        distance += velocity * dt
+
+
+# Integrator kernels and the time step each needs for comparable accuracy
+INTEGRATORS = {
+    'euler': _euler_advance,
+    'rk4': _rk4_advance,
+    'leapfrog': _leapfrog_advance,
+}
+DEFAULT_TIME_STEPS = {
+    'euler': 10.0,
+    'rk4': 60.0,
+    'leapfrog': 60.0,
+}
 
 
 class OrbitalSimulator:
     """Base orbital simulator using standard Python floats."""
     
-    def __init__(self, altitude_km: float, velocity_kmps: float):
+    # Dormand-Prince 5(4) tableau. The system is autonomous, so the c_i nodes
+    # are not needed.
+    DOPRI_A = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    )
+    DOPRI_B = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0)
+    DOPRI_B_STAR = (5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200,
+                    187 / 2100, 1 / 40)
+    
+    def __init__(self, altitude_km: float, velocity_kmps: float, integrator: str = 'euler'):
         """
         Initialize orbital simulator.
         
         Args:
             altitude_km: Satellite altitude in kilometers
             velocity_kmps: Orbital velocity in kilometers per second
+            integrator: One of 'euler', 'rk4' or 'leapfrog' (default 'euler')
         """
-        self.EARTH_RADIUS = 6371.0  # km
-        self.GM = 3.986004418e5  # km^3/s^2 (Earth's standard gravitational parameter)
-        self.DRAG_COEFFICIENT = 1e-10  # Simplified atmospheric drag
+        if integrator not in INTEGRATORS:
+            raise ValueError(f"Unknown integrator '{integrator}'")
+        self.integrator = integrator
+        self._advance = INTEGRATORS[integrator]
+        
+        self.EARTH_RADIUS = EARTH_RADIUS_KM
+        self.GM = EARTH_GM
+        self.DRAG_COEFFICIENT = DRAG_COEFFICIENT
         
-        self.altitude = altitude_km
         self.velocity = velocity_kmps
         self.distance = self.EARTH_RADIUS + altitude_km
         self.time = 0.0
-        self.total_energy = self._calculate_energy()
+    
+    @property
+    def altitude(self) -> float:
+        """Altitude above Earth's surface in kilometers."""
+        return self.distance - self.EARTH_RADIUS
+    
+    @property
+    def total_energy(self) -> float:
+        """Total mechanical energy, evaluated on demand."""
+        return self._calculate_energy()
     
     def _calculate_energy(self) -> float:
         """Calculate total mechanical energy (kinetic + potential)."""
-        kinetic = 0.5 * self.velocity ** 2
+        kinetic = 0.5 * self.velocity * self.velocity
         potential = -self.GM / self.distance
         return kinetic + potential
     
     def step(self, dt: float) -> None:
         """
-        Perform one simulation step using Euler method with atmospheric drag.
+        Perform one simulation step with the configured integrator and atmospheric drag.
         
         Args:
             dt: Time step in seconds
         """
-        # Gravity acceleration
-        gravity = self.GM / (self.distance ** 2)
+        distance, velocity = self._advance(
+            self.distance, self.velocity, self.GM, self.DRAG_COEFFICIENT, dt, 1)
+        self.distance = distance
+        self.velocity = velocity
+        self.time += dt
+    
+    def advance(self, dt: float, n_steps: int) -> None:
+        """
+        Perform n_steps integrator steps in a single call.
+        
+        Args:
+            dt: Time step in seconds
+            n_steps: Number of steps to take
+        """
+        self.distance, self.velocity = self._advance(
+            self.distance, self.velocity, self.GM, self.DRAG_COEFFICIENT, dt, n_steps)
+        self.time += dt * n_steps
+    
+    def step_dopri5(self, dt: float, tol: float = 1e-9, dt_min: float = 1e-6) -> float:
+        """
+        Take one adaptive Dormand-Prince 5(4) step of at most dt seconds.
         
-        # Atmospheric drag (simplified model)
-        drag_accel = -self.DRAG_COEFFICIENT * self.velocity ** 2
+        Trial steps whose embedded error estimate exceeds tol are retried
+        with a smaller step; the accepted step advances self.time.
         
-        # Update velocity and position
-        self.velocity += (drag_accel - gravity) * dt
-        self.distance += self.velocity * dt
-        self.altitude = self.distance - self.EARTH_RADIUS
+        Args:
+            dt: Trial step size in seconds
+            tol: Mixed absolute/relative error tolerance per step
+            dt_min: Smallest step a rejected trial may shrink to, in seconds
+        
+        Returns:
+            Suggested size of the next step in seconds
+        
+        Raises:
+            RuntimeError: If meeting tol would need a step below dt_min, e.g.
+                when the satellite reaches the singularity at r = 0
+        """
+        GM = self.GM
+        drag = self.DRAG_COEFFICIENT
+        d = self.distance
+        v = self.velocity
+        
+        while True:
+            kd = []
+            kv = []
+            for row in self.DOPRI_A:
+                sd = d + dt * sum(a * k for a, k in zip(row, kd))
+                sv = v + dt * sum(a * k for a, k in zip(row, kv))
+                kd.append(sv)
+                kv.append(-drag * sv * sv - GM / (sd * sd))
+            
+            d5 = d + dt * sum(b * k for b, k in zip(self.DOPRI_B, kd))
+            v5 = v + dt * sum(b * k for b, k in zip(self.DOPRI_B, kv))
+            d4 = d + dt * sum(b * k for b, k in zip(self.DOPRI_B_STAR, kd))
+            v4 = v + dt * sum(b * k for b, k in zip(self.DOPRI_B_STAR, kv))
+            
+            err = max(abs(d5 - d4) / (tol * (1 + max(abs(d), abs(d5)))),
+                      abs(v5 - v4) / (tol * (1 + max(abs(v), abs(v5)))))
+            scale = 5.0 if err == 0 else min(5.0, max(0.2, 0.9 * err ** -0.2))
+            if err <= 1:
+                break
+            dt *= scale
+            if dt < dt_min:
+                raise RuntimeError(
+                    f"Step size fell below dt_min={dt_min:g} s at t={self.time:.6f} s "
+                    f"(distance {self.distance:.6g} km); the solution is not "
+                    f"resolvable at tol={tol:g}"
+                )
+        
+        self.distance = d5
+        self.velocity = v5
         self.time += dt
-        self.total_energy = self._calculate_energy()
+        return dt * scale
+    
+    def advance_adaptive(self, duration: float, dt_hint: float = 60.0,
+                         tol: float = 1e-9, dt_min: float = 1e-6) -> int:
+        """
+        Integrate for duration seconds with adaptive Dormand-Prince steps.
+        
+        Args:
+            duration: Time to advance in seconds
+            dt_hint: Initial trial step size in seconds
+            tol: Error tolerance passed to step_dopri5
+            dt_min: Minimum step size passed to step_dopri5
+        
+        Returns:
+            Number of accepted steps
+        
+        Raises:
+            RuntimeError: If the step size collapses below dt_min
+        """
+        t_end = self.time + duration
+        dt = dt_hint
+        n_steps = 0
+        while self.time < t_end:
+            dt = self.step_dopri5(min(dt, t_end - self.time), tol, dt_min)
+            n_steps += 1
+        return n_steps
     
     def get_state(self) -> dict:
         """Return current simulation state."""
@@ -75,90 +309,242 @@ class OrbitalSimulator:
 
 
 class DecimalOrbitalSimulator:
-    """Orbital simulator using Python's Decimal type for enhanced precision."""
+    """
+    Orbital simulator using Python's Decimal type for enhanced precision.
+    
+    With use_compensated=True and at most COMPENSATED_MAX_PRECISION digits, the
+    state is instead kept in float64 with Kahan-compensated updates; this is
+    opt-in, so by default all arithmetic is Decimal (or mpmath).
+    """
+    
+    # float64 carries ~17 significant digits; beyond this only Decimal will do
+    COMPENSATED_MAX_PRECISION = 18
+    _HALF = Decimal('0.5')
     
-    def __init__(self, altitude_km: str, velocity_kmps: str, precision: int = 50):
+    def __init__(self, altitude_km: str, velocity_kmps: str, precision: int = 50,
+                 use_compensated: bool = False, precision_inner: Optional[int] = None,
+                 precision_report: Optional[int] = None, step_dt: str = '10',
+                 backend: str = 'decimal'):
         """
         Initialize decimal-based orbital simulator.
         
+        Arithmetic runs in private Decimal (or mpmath) contexts, so the
+        process-wide context is left untouched.
+        
         Args:
             altitude_km: Satellite altitude in kilometers (as string for Decimal)
             velocity_kmps: Orbital velocity in kilometers per second (as string)
             precision: Number of significant digits (default 50)
+            use_compensated: Integrate in float64 with Kahan-compensated sums
+                when precision_inner <= COMPENSATED_MAX_PRECISION; Decimal
+                backend only (default False)
+            precision_inner: Digits used inside step() (default: precision)
+            precision_report: Digits used for energy reporting (default: precision)
+            step_dt: Fixed time step in seconds used by step() (as string for Decimal)
+            backend: 'decimal' or 'mpmath'; mpmath is only faster when it
+                runs on gmpy2 (default 'decimal')
         """
-        getcontext().prec = precision
+        if backend not in ('decimal', 'mpmath'):
+            raise ValueError(f"Unknown backend '{backend}'")
+        self.backend = backend
+        
+        precision_inner = precision_inner or precision
+        precision_report = precision_report or precision
+        self._precision_report = precision_report
+        self._ctx = Context(prec=precision_inner, rounding=ROUND_HALF_EVEN)
+        self._report_ctx = Context(prec=precision_report, rounding=ROUND_HALF_EVEN)
         
         self.EARTH_RADIUS = Decimal('6371')  # km
         self.GM = Decimal('3.986004418e5')  # km^3/s^2
         self.DRAG_COEFFICIENT = Decimal('1e-10')  # Simplified atmospheric drag
         
-        self.altitude = Decimal(altitude_km)
+        self.use_compensated = (use_compensated and backend == 'decimal' and
+                                precision_inner <= self.COMPENSATED_MAX_PRECISION)
+        
         self.velocity = Decimal(velocity_kmps)
-        self.distance = self.EARTH_RADIUS + self.altitude
+        self.distance = self._ctx.add(self.EARTH_RADIUS, Decimal(altitude_km))
         self.time = Decimal('0')
-        self.total_energy = self._calculate_energy()
-    
-    def _calculate_energy(self) -> Decimal:
-        """Calculate total mechanical energy (kinetic + potential)."""
-        kinetic = Decimal('0.5') * self.velocity ** 2
-        potential = -self.GM / self.distance
-        return kinetic + potential
+        
+        # Snapshot cache for get_state()
+        self._state = {'time': 0.0, 'altitude': 0.0, 'velocity': 0.0,
+                       'distance': 0.0, 'energy': 0.0}
+        self._state_dirty = True
+        
+        # Per-step invariants
+        self._dt = Decimal(step_dt)
+        self._neg_drag = self._ctx.minus(self.DRAG_COEFFICIENT)
+        
+        if self.use_compensated:
+            # float64 state plus the low-order bits each update would drop
+            self.EARTH_RADIUS = float(self.EARTH_RADIUS)
+            self.GM = float(self.GM)
+            self.DRAG_COEFFICIENT = float(self.DRAG_COEFFICIENT)
+            self.velocity = float(self.velocity)
+            self.distance = float(self.distance)
+            self.time = 0.0
+            self._dt = float(self._dt)
+            self._neg_drag = -self.DRAG_COEFFICIENT
+            self._v_c = 0.0
+            self._d_c = 0.0
+            self._t_c = 0.0
+        elif backend == 'mpmath':
+            self._init_mpmath(precision_inner)
     
-    def step(self, dt: str) -> None:
+    def _init_mpmath(self, precision: int) -> None:
         """
-        Perform one simulation step using Euler method with atmospheric drag.
+        Move the Decimal state onto a private mpmath context.
         
         Args:
-            dt: Time step in seconds (as string for Decimal)
+            precision: Working precision in decimal digits
         """
-        dt = Decimal(dt)
+        try:
+            import mpmath
+        except ImportError as e:
+            raise ImportError("backend='mpmath' requires the mpmath package") from e
+        if mpmath.libmp.BACKEND != 'gmpy':
+            # stacklevel 3: _init_mpmath <- __init__ <- the caller's constructor call
+            warnings.warn("mpmath is running without gmpy2; expect it to be "
+                          "slower than the Decimal backend", RuntimeWarning, stacklevel=3)
         
-        # Gravity acceleration
-        gravity = self.GM / (self.distance ** 2)
+        mp = mpmath.MPContext()
+        mp.dps = precision
+        self._mp = mp
+        self.EARTH_RADIUS = mp.mpf(str(self.EARTH_RADIUS))
+        self.GM = mp.mpf(str(self.GM))
+        self.DRAG_COEFFICIENT = mp.mpf(str(self.DRAG_COEFFICIENT))
+        self.velocity = mp.mpf(str(self.velocity))
+        self.distance = mp.mpf(str(self.distance))
+        self.time = mp.mpf(0)
+        self._dt = mp.mpf(str(self._dt))
+        self._neg_drag = -self.DRAG_COEFFICIENT
+    
+    @property
+    def altitude(self) -> Union[Decimal, float]:
+        """Altitude above Earth's surface in kilometers."""
+        if self.backend == 'decimal' and not self.use_compensated:
+            return self._ctx.subtract(self.distance, self.EARTH_RADIUS)
+        return self.distance - self.EARTH_RADIUS
+    
+    @property
+    def total_energy(self) -> Union[Decimal, float]:
+        """Total mechanical energy, evaluated on demand."""
+        return self._calculate_energy()
+    
+    def _calculate_energy(self) -> Union[Decimal, float]:
+        """Calculate total mechanical energy (kinetic + potential)."""
+        if self.use_compensated:
+            return 0.5 * self.velocity * self.velocity - self.GM / self.distance
+        if self.backend == 'mpmath':
+            with self._mp.workdps(self._precision_report):
+                return 0.5 * self.velocity * self.velocity - self.GM / self.distance
+        ctx = self._report_ctx
+        kinetic = ctx.multiply(self._HALF, ctx.multiply(self.velocity, self.velocity))
+        potential = ctx.minus(ctx.divide(self.GM, self.distance))
+        return ctx.add(kinetic, potential)
+    
+    def step(self) -> None:
+        """Perform one simulation step of step_dt seconds using Euler method with atmospheric drag."""
+        self._state_dirty = True
+        if self.use_compensated:
+            self._step_compensated()
+            return
+        if self.backend == 'mpmath':
+            self._step_mpmath()
+            return
+        
+        ctx = self._ctx
+        dt = self._dt
+        v = self.velocity
+        d = self.distance
         
-        # Atmospheric drag (simplified model)
-        drag_accel = -self.DRAG_COEFFICIENT * self.velocity ** 2
+        # Drag (simplified model) minus gravity
+        accel = ctx.subtract(ctx.multiply(self._neg_drag, ctx.multiply(v, v)),
+                             ctx.divide(self.GM, ctx.multiply(d, d)))
         
-        # Update velocity and position
-        self.velocity += (drag_accel - gravity) * dt
-        self.distance += self.velocity * dt
-        self.altitude = self.distance - self.EARTH_RADIUS
+        # Update velocity and position, each with a single rounding
+        v = ctx.fma(accel, dt, v)
+        d = ctx.fma(v, dt, d)
+        self.velocity = v
+        self.distance = d
+        self.time = ctx.add(self.time, dt)
+    
+    def _step_mpmath(self) -> None:
+        """Euler step on mpmath mpf values at the context's precision."""
+        dt = self._dt
+        d = self.distance
+        v = self.velocity
+        accel = self._neg_drag * v * v - self.GM / (d * d)
+        
+        v += accel * dt
+        d += v * dt
+        self.velocity = v
+        self.distance = d
         self.time += dt
-        self.total_energy = self._calculate_energy()
+    
+    def _step_compensated(self) -> None:
+        """Euler step in float64 with Kahan-compensated state updates."""
+        dt = self._dt
+        d = self.distance
+        v = self.velocity
+        accel = self._neg_drag * v * v - self.GM / (d * d)
+        
+        v, self._v_c = _compensated_add(v, self._v_c, accel * dt)
+        d, self._d_c = _compensated_add(d, self._d_c, v * dt)
+        self.time, self._t_c = _compensated_add(self.time, self._t_c, dt)
+        self.velocity = v
+        self.distance = d
     
     def get_state(self) -> dict:
-        """Return current simulation state."""
-        return {
-            'time': float(self.time),
-            'altitude': float(self.altitude),
-            'velocity': float(self.velocity),
-            'distance': float(self.distance),
-            'energy': float(self.total_energy)
-        }
+        """
+        Return current simulation state.
+        
+        The float conversions are cached until the next step(), so repeated
+        snapshots between steps cost only a dict copy.
+        """
+        if self._state_dirty:
+            state = self._state
+            state['time'] = float(self.time)
+            state['altitude'] = float(self.altitude)
+            state['velocity'] = float(self.velocity)
+            state['distance'] = float(self.distance)
+            state['energy'] = float(self.total_energy)
+            self._state_dirty = False
+        return self._state.copy()
 
 
-def run_simulation_comparison(duration_hours: int = 24) -> Tuple[List[dict], List[dict]]:
+def run_simulation_comparison(duration_hours: int = 24, integrator: str = 'euler',
+                              backend: str = 'decimal') -> Tuple[List[dict], List[dict]]:
     """
     Run orbital decay simulation with both Float and Decimal implementations.
     
+    The Decimal simulator always uses Euler with 10 second steps; the float
+    simulator uses the chosen integrator at its DEFAULT_TIME_STEPS step.
+    
     Args:
         duration_hours: Simulation duration in hours
+        integrator: Float simulator integrator ('euler', 'rk4' or 'leapfrog')
+        backend: High-precision simulator backend ('decimal' or 'mpmath')
     
     Returns:
         Tuple of (float_results, decimal_results) containing state snapshots
     """
     # Initial conditions: 400 km altitude, circular orbit
     initial_altitude = 400.0  # km
-    initial_velocity = math.sqrt(3.986004418e5 / (6371.0 + initial_altitude))  # circular orbit
+    initial_velocity = math.sqrt(EARTH_GM / (EARTH_RADIUS_KM + initial_altitude))  # circular orbit
     
     dt = 10.0  # 10 second time steps
-    steps = int(duration_hours * 3600 / dt)
+    steps_per_hour = int(3600 / dt)
+    steps = duration_hours * steps_per_hour
+    float_dt = DEFAULT_TIME_STEPS[integrator]
+    float_steps_per_hour = int(3600 / float_dt)
     
     # Initialize simulators
-    float_sim = OrbitalSimulator(initial_altitude, initial_velocity)
+    float_sim = OrbitalSimulator(initial_altitude, initial_velocity, integrator=integrator)
     decimal_sim = DecimalOrbitalSimulator(
         str(initial_altitude),
-        str(initial_velocity)
+        str(initial_velocity),
+        step_dt=str(dt),
+        backend=backend
     )
     
     float_results = [float_sim.get_state()]
@@ -167,25 +553,62 @@ def run_simulation_comparison(duration_hours: int = 24) -> Tuple[List[dict], Lis
     print(f"Running orbital decay simulation for {duration_hours} hours...")
     print(f"Initial altitude: {initial_altitude} km")
     print(f"Initial velocity: {initial_velocity:.6f} km/s")
-    print(f"Time steps: {steps} (dt = {dt}s)\n")
+    print(f"Time steps: {steps} (dt = {dt}s)")
+    print(f"Float integrator: {integrator} "
+          f"({duration_hours * float_steps_per_hour} steps, dt = {float_dt}s)\n")
     
-    # Run simulation
-    for step in range(steps):
-        float_sim.step(dt)
-        decimal_sim.step(str(dt))
+    # Run simulation one hour at a time, recording a snapshot after each hour
+    for hour in range(1, duration_hours + 1):
+        float_sim.advance(float_dt, float_steps_per_hour)
+        for _ in range(steps_per_hour):
+            decimal_sim.step()
         
-        # Record every 360th step (1 hour) to reduce output
-        if (step + 1) % 360 == 0:
-            float_results.append(float_sim.get_state())
-            decimal_results.append(decimal_sim.get_state())
-            
-            hours_elapsed = (step + 1) * dt / 3600
-            print(f"Hour {hours_elapsed:.1f}: Alt={float_sim.altitude:.2f} km (Float) "
-                  f"vs {decimal_sim.altitude:.2f} km (Decimal)")
+        float_results.append(float_sim.get_state())
+        decimal_results.append(decimal_sim.get_state())
+        
+        print(f"Hour {hour:.1f}: Alt={float_sim.altitude:.2f} km (Float) "
+              f"vs {decimal_sim.altitude:.2f} km (Decimal)")
     
     return float_results, decimal_results
 
 
+def run_simulation_batch(altitudes: np.ndarray, duration_hours: int = 24) -> List[dict]:
+    """
+    Run the float Euler simulation for many initial altitudes at once.
+    
+    Every satellite starts on a circular orbit; one vectorized update
+    advances all of them per time step.
+    
+    Args:
+        altitudes: (N,) initial altitudes in kilometers
+        duration_hours: Simulation duration in hours
+    
+    Returns:
+        Hourly state snapshots; each value is an (N,) array except 'time'
+    """
+    dt = DEFAULT_TIME_STEPS['euler']
+    steps_per_hour = int(3600 / dt)
+    
+    distance = EARTH_RADIUS_KM + np.asarray(altitudes, dtype=np.float64)
+    velocity = np.sqrt(EARTH_GM / distance)
+    
+    def snapshot(hour: int) -> dict:
+        return {
+            'time': hour * 3600.0,
+            'altitude': distance - EARTH_RADIUS_KM,
+            'velocity': velocity.copy(),
+            'distance': distance.copy(),
+            'energy': 0.5 * velocity * velocity - EARTH_GM / distance
+        }
+    
+    results = [snapshot(0)]
+    for hour in range(1, duration_hours + 1):
+        _batch_euler(distance, velocity, EARTH_GM, DRAG_COEFFICIENT, dt, steps_per_hour)
+        results.append(snapshot(hour))
+    
+    return results
+
+
 def analyze_results(float_results: List[dict], decimal_results: List[dict]) -> None:
     """
     Analyze and display simulation results, highlighting numerical stability differences.
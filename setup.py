@@ -1,11 +1,17 @@
 from setuptools import setup, find_packages
 
+
+def _read_long_description():
+    with open("README.md", encoding="utf-8") as f:
+        return f.read()
+
+
 setup(
     name="decimal-physics-controller",
     version="0.1.0",
     author="David A. Besemer",
     description="Precise physics simulations using decimal arithmetic",
-    long_description=open("README.md").read(),
+    long_description=_read_long_description(),
     long_description_content_type="text/markdown",
     url="https://github.com/davidbesemer132/decimal-physics-controller",
     packages=find_packages(),
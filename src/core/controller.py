@@ -5,16 +5,44 @@ This module provides high-precision physics calculations using Python's Decimal
 for all critical computations, ensuring accuracy in numerical simulations.
 """
 
-from decimal import Decimal, getcontext, ROUND_HALF_UP
-from typing import Dict, List, Tuple, Optional
+from decimal import Decimal, getcontext, localcontext, ROUND_HALF_UP
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from collections.abc import Sequence
+import bisect
 import math
+import operator
+
+import numpy as np
 
 
 # Set high precision for Decimal calculations
 getcontext().prec = 50
 
+# apply_forces evaluates pairs in chunks of _FORCE_BLOCK * N to bound its temporaries
+_FORCE_BLOCK = 64
+
+# Largest fast_mode system handled by the dense (N, N, 3) force kernel; above it
+# the pairwise kernel keeps memory bounded
+_DENSE_MAX_N = 256
+
+# Working precision for force evaluation; positions, velocities and energies keep
+# the full module precision
+_FORCE_PRECISION = 25
+
+# Force evaluation methods accepted by DecimalPhysicsController
+FORCE_METHODS = ('direct', 'barnes_hut')
+
+# Largest number of bodies a Barnes-Hut leaf holds; leaf interactions are
+# evaluated directly, so small buckets trade a few extra pairs for a far
+# shallower tree
+_BH_LEAF_SIZE = 8
+
+# PhysicsObject vectors that live in a controller's state arrays while the
+# object belongs to it, and the array holding each
+_STATE_ARRAYS = {'position': '_pos', 'velocity': '_vel', 'acceleration': '_acc'}
+
 
 class PhysicsConstants:
     """Universal physics constants with Decimal precision."""
@@ -29,6 +57,11 @@ class PhysicsConstants:
     VACUUM_PERMEABILITY = Decimal('1.25663706212E-6')  # H/m
 
 
+# Module-level bindings of G for the force and energy code (Decimal and float64)
+_G = PhysicsConstants.GRAVITATIONAL_CONSTANT
+_G_F = float(_G)
+
+
 class SimulationMode(Enum):
     """Supported simulation modes."""
     CLASSICAL_MECHANICS = "classical"
@@ -50,11 +83,18 @@ class Vector3D:
         self.y = Decimal(str(self.y)) if not isinstance(self.y, Decimal) else self.y
         self.z = Decimal(str(self.z)) if not isinstance(self.z, Decimal) else self.z
     
+    @classmethod
+    def _from_decimals(cls, x: Decimal, y: Decimal, z: Decimal) -> 'Vector3D':
+        """Build a vector from components already known to be Decimal, skipping __post_init__."""
+        vector = cls.__new__(cls)
+        vector.x = x
+        vector.y = y
+        vector.z = z
+        return vector
+    
     def magnitude(self) -> Decimal:
         """Calculate the magnitude of the vector."""
-        sum_squares = self.x ** 2 + self.y ** 2 + self.z ** 2
-        # Use decimal approximation for square root
-        return self._decimal_sqrt(sum_squares)
+        return (self.x * self.x + self.y * self.y + self.z * self.z).sqrt()
     
     def dot_product(self, other: 'Vector3D') -> Decimal:
         """Calculate dot product with another vector."""
@@ -62,39 +102,79 @@ class Vector3D:
     
     def cross_product(self, other: 'Vector3D') -> 'Vector3D':
         """Calculate cross product with another vector."""
-        return Vector3D(
+        return Vector3D._from_decimals(
             self.y * other.z - self.z * other.y,
             self.z * other.x - self.x * other.z,
             self.x * other.y - self.y * other.x
         )
     
-    @staticmethod
-    def _decimal_sqrt(value: Decimal) -> Decimal:
-        """Calculate square root using Newton's method for Decimal precision."""
-        if value < 0:
-            raise ValueError("Cannot calculate square root of negative number")
-        if value == 0:
-            return Decimal(0)
-        
-        # Initial guess
-        x = value
-        while True:
-            x_new = (x + value / x) / 2
-            if abs(x_new - x) < Decimal(10) ** -(getcontext().prec - 5):
-                return x_new
-            x = x_new
-    
     def normalize(self) -> 'Vector3D':
         """Return normalized vector."""
         mag = self.magnitude()
         if mag == 0:
             raise ValueError("Cannot normalize zero vector")
-        return Vector3D(self.x / mag, self.y / mag, self.z / mag)
+        return Vector3D._from_decimals(self.x / mag, self.y / mag, self.z / mag)
+
+
+class _StateVector(Vector3D):
+    """
+    Vector3D whose components are one row of a controller's state array.
+    
+    An object added to a DecimalPhysicsController holds these as its position,
+    velocity and acceleration, so reading a component always shows the current
+    simulation state and assigning one writes it into the array. When the
+    object is removed the vector keeps its last value as a plain vector.
+    """
+    
+    def __init__(self, physics: 'DecimalPhysicsController', obj: 'PhysicsObject', array: str):
+        self._physics = physics
+        self._obj = obj
+        self._array = array
+        self._values: Optional[List[Decimal]] = None
+    
+    def _get(self, k: int) -> Decimal:
+        if self._physics is None:
+            return self._values[k]
+        return self._physics._read_component(self._obj, self._array, k)
+    
+    def _set(self, k: int, value) -> None:
+        value = value if isinstance(value, Decimal) else Decimal(str(value))
+        if self._physics is None:
+            self._values[k] = value
+        else:
+            self._physics._write_component(self._obj, self._array, k, value)
+    
+    x = property(lambda self: self._get(0), lambda self, value: self._set(0, value))
+    y = property(lambda self: self._get(1), lambda self, value: self._set(1, value))
+    z = property(lambda self: self._get(2), lambda self, value: self._set(2, value))
+    
+    def _detach(self) -> None:
+        """Keep the current components and stop following the controller."""
+        self._values = [self.x, self.y, self.z]
+        self._physics = None
+    
+    def __eq__(self, other):
+        if not isinstance(other, Vector3D):
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"Vector3D(x={self.x!r}, y={self.y!r}, z={self.z!r})"
 
 
 @dataclass
 class PhysicsObject:
-    """Represents a physical object with mass and position."""
+    """
+    Represents a physical object with mass and position.
+    
+    Fields are validated and the mass converted to Decimal on construction, and
+    again when the object is added to a DecimalPhysicsController in case they
+    were reassigned in between. While it belongs to one, its vectors
+    are live views of the controller's state and assignments to its mass or
+    vectors are written through to the controller.
+    """
     name: str
     mass: Decimal
     position: Vector3D
@@ -102,14 +182,112 @@ class PhysicsObject:
     acceleration: Vector3D = field(default_factory=lambda: Vector3D(Decimal(0), Decimal(0), Decimal(0)))
     
     def __post_init__(self):
-        """Ensure mass and vectors use Decimal."""
-        self.mass = Decimal(str(self.mass)) if not isinstance(self.mass, Decimal) else self.mass
-        if not isinstance(self.position, Vector3D):
-            raise TypeError("position must be a Vector3D")
-        if not isinstance(self.velocity, Vector3D):
-            raise TypeError("velocity must be a Vector3D")
-        if not isinstance(self.acceleration, Vector3D):
-            raise TypeError("acceleration must be a Vector3D")
+        """Fail at construction, not mid-simulation, on badly typed fields."""
+        self._validate()
+    
+    def _validate(self) -> None:
+        """Check the vector fields are Vector3D and convert the mass to Decimal."""
+        for name in _STATE_ARRAYS:
+            if not isinstance(getattr(self, name), Vector3D):
+                raise TypeError(f"{name} must be a Vector3D")
+        if not isinstance(self.mass, Decimal):
+            self.mass = Decimal(str(self.mass))
+    
+    def __setattr__(self, name: str, value) -> None:
+        physics = self.__dict__.get('_physics')
+        if physics is not None and (name == 'mass' or name in _STATE_ARRAYS):
+            physics._assign_state(self, name, value)
+        else:
+            super().__setattr__(name, value)
+
+
+@dataclass(eq=False)
+class SimulationHistory:
+    """
+    Columnar record of a simulation run.
+    
+    Per-step state is stored as float64 arrays indexed by step, instead of one
+    nested dict per step. Indexing or iterating yields the per-step snapshot
+    dicts for callers that expect them.
+    """
+    names: List[str]
+    time: np.ndarray  # (K,)
+    total_energy: np.ndarray  # (K,)
+    positions: np.ndarray  # (K, N, 3)
+    velocities: np.ndarray  # (K, N, 3)
+    accelerations: np.ndarray  # (K, N, 3)
+    
+    def __len__(self) -> int:
+        return len(self.time)
+    
+    def __getitem__(self, step: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        """Return the snapshot dict for one step, or a list of them for a slice."""
+        if isinstance(step, slice):
+            return [self[k] for k in range(*step.indices(len(self)))]
+        positions = self.positions[step].tolist()
+        velocities = self.velocities[step].tolist()
+        accelerations = self.accelerations[step].tolist()
+        return {
+            'time': float(self.time[step]),
+            'total_energy': float(self.total_energy[step]),
+            'objects': {
+                name: {
+                    'position': tuple(position),
+                    'velocity': tuple(velocity),
+                    'acceleration': tuple(acceleration)
+                }
+                for name, position, velocity, acceleration
+                in zip(self.names, positions, velocities, accelerations)
+            }
+        }
+    
+    def __iter__(self):
+        for step in range(len(self)):
+            yield self[step]
+    
+    def as_dict_list(self) -> List[Dict]:
+        """Materialize the run as a list of per-step snapshot dicts."""
+        return list(self)
+
+
+class StepHistory(Sequence):
+    """
+    Step-indexed view over every run recorded by a controller.
+    
+    Behaves like a list of per-step snapshot dicts: its length is the total
+    number of steps, and indexing, slicing and iteration yield snapshot dicts
+    across all runs. The columnar SimulationHistory of each run is kept
+    in ``runs``; snapshots are only built when they are read.
+    """
+    
+    def __init__(self):
+        self.runs: List[SimulationHistory] = []
+        self._ends: List[int] = []  # cumulative step count at the end of each run
+    
+    def _add_run(self, run: SimulationHistory) -> None:
+        """Append one run's history."""
+        if len(run):
+            self.runs.append(run)
+            self._ends.append(len(self) + len(run))
+    
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("simulation history index out of range")
+        run = bisect.bisect_right(self._ends, index)
+        start = self._ends[run - 1] if run else 0
+        return self.runs[run][index - start]
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for run in self.runs:
+            yield from run
 
 
 class DecimalPhysicsController:
@@ -118,21 +296,79 @@ class DecimalPhysicsController:
     
     This controller manages simulation state, calculates forces, and updates object
     states with decimal precision for critical calculations.
+    
+    Object state is held in structure-of-arrays form: one (N, 3) array each for
+    positions, velocities and accelerations and an (N,) mass array, with rows in
+    insertion order. The arrays hold Decimal elements, so every update is still
+    exact Decimal arithmetic. The position, velocity and acceleration of each
+    added PhysicsObject are views of its rows, so ``objects`` and any vector
+    references a caller holds always show the current state, edits made to
+    them are written straight into the arrays, and stepping never copies
+    object state in or out.
+    
+    With fast_mode enabled the arrays hold float64 instead, and forces and
+    integration run in hardware floating point. Values are converted back to
+    Decimal only where they are read (PhysicsObject components and
+    total_energy). The Decimal path remains the reference for precision.
     """
     
-    def __init__(self, mode: SimulationMode = SimulationMode.CLASSICAL_MECHANICS):
+    def __init__(self, mode: SimulationMode = SimulationMode.CLASSICAL_MECHANICS,
+                 fast_mode: bool = False, force_method: str = 'direct'):
         """
         Initialize the physics controller.
         
         Args:
             mode: The simulation mode to use
+            fast_mode: Run forces and integration in float64 instead of Decimal
+            force_method: 'direct' for the exact pair sum, or 'barnes_hut' for the
+                O(N log N) octree approximation (computed in float64; worthwhile
+                from roughly a thousand objects)
         """
+        if force_method not in FORCE_METHODS:
+            raise ValueError(f"Unknown force_method '{force_method}'")
         self.mode = mode
+        self.fast_mode = fast_mode
+        self.force_method = force_method
+        
+        # Numeric type of the working arrays and the constants cast to it
+        self._num = float if fast_mode else Decimal
+        self._dtype = float if fast_mode else object
+        self._G = _G_F if fast_mode else _G
+        
         self.objects: Dict[str, PhysicsObject] = {}
-        self.time_step: Decimal = Decimal('0.01')  # Default 10ms
+        self._object_list: List[PhysicsObject] = []  # objects in array-row order
+        self.time_step = Decimal('0.01')  # Default 10ms
         self.current_time: Decimal = Decimal(0)
         self.total_energy: Decimal = Decimal(0)
-        self.simulation_history: List[Dict] = []
+        self.simulation_history = StepHistory()  # one snapshot per step, across runs
+        
+        # Structure-of-arrays object state, one row per object
+        self._index: Dict[str, int] = {}
+        self._mass = np.empty(0, dtype=self._dtype)
+        self._pos = np.empty((0, 3), dtype=self._dtype)
+        self._vel = np.empty((0, 3), dtype=self._dtype)
+        self._acc = np.empty((0, 3), dtype=self._dtype)
+        
+        # Whether _acc holds the forces for the current positions
+        self._acc_valid = False
+        
+        # Upper-triangle pair indices, cached for the object count they were built for
+        self._pair_idx_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._pair_idx_N = -1
+        
+        # Barnes-Hut opening angle used by force_method='barnes_hut'
+        self.theta: float = 0.5
+    
+    @property
+    def time_step(self) -> Decimal:
+        """Simulation time step in seconds."""
+        return self._time_step
+    
+    @time_step.setter
+    def time_step(self, value: Decimal) -> None:
+        self._time_step = value
+        self._dt = self._num(value)
+        self._half_dt = self._dt / 2
     
     def set_time_step(self, time_step: float) -> None:
         """
@@ -147,12 +383,31 @@ class DecimalPhysicsController:
         """
         Add an object to the simulation.
         
+        The object's state is moved into the controller's arrays. Until it is
+        removed again its vectors read and write those arrays directly.
+        
         Args:
             obj: PhysicsObject to add
         """
         if obj.name in self.objects:
             raise ValueError(f"Object '{obj.name}' already exists in simulation")
+        if obj.__dict__.get('_physics') is not None:
+            raise ValueError(f"Object '{obj.name}' already belongs to a simulation")
+        obj._validate()
+        
         self.objects[obj.name] = obj
+        self._object_list.append(obj)
+        self._index[obj.name] = len(self._index)
+        self._mass = np.append(self._mass, np.array([obj.mass], dtype=self._dtype))
+        self._pos = np.vstack([self._pos, self._row(obj.position)])
+        self._vel = np.vstack([self._vel, self._row(obj.velocity)])
+        self._acc = np.vstack([self._acc, self._row(obj.acceleration)])
+        self._acc_valid = False
+        self._pair_idx_cache = None
+        
+        for name, array in _STATE_ARRAYS.items():
+            object.__setattr__(obj, name, _StateVector(self, obj, array))
+        obj._physics = self
     
     def remove_object(self, name: str) -> None:
         """
@@ -163,7 +418,58 @@ class DecimalPhysicsController:
         """
         if name not in self.objects:
             raise ValueError(f"Object '{name}' not found in simulation")
+        obj = self.objects[name]
+        for attr in _STATE_ARRAYS:
+            getattr(obj, attr)._detach()
+        del obj._physics
+        
+        row = self._index.pop(name)
         del self.objects[name]
+        del self._object_list[row]
+        self._mass = np.delete(self._mass, row)
+        self._pos = np.delete(self._pos, row, axis=0)
+        self._vel = np.delete(self._vel, row, axis=0)
+        self._acc = np.delete(self._acc, row, axis=0)
+        self._acc_valid = False
+        self._pair_idx_cache = None
+        self._index = {obj.name: i for i, obj in enumerate(self._object_list)}
+    
+    def _row(self, vector: Vector3D) -> np.ndarray:
+        """Convert a Vector3D into a (1, 3) row of the working array type."""
+        return np.array([[vector.x, vector.y, vector.z]], dtype=self._dtype)
+    
+    def _pair_indices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (i, j) index arrays of all unordered object pairs, i < j."""
+        n = len(self._object_list)
+        if self._pair_idx_cache is None or self._pair_idx_N != n:
+            self._pair_idx_cache = np.triu_indices(n, k=1)
+            self._pair_idx_N = n
+        return self._pair_idx_cache
+    
+    def _read_component(self, obj: PhysicsObject, array: str, k: int) -> Decimal:
+        """Return component k of obj's row in a state array as a Decimal."""
+        value = getattr(self, array)[self._index[obj.name], k]
+        return Decimal(str(value)) if self.fast_mode else value
+    
+    def _write_component(self, obj: PhysicsObject, array: str, k: int, value: Decimal) -> None:
+        """Store component k of obj's row in a state array."""
+        getattr(self, array)[self._index[obj.name], k] = self._num(value)
+        if array != '_vel':
+            # Moved objects, and caller-assigned accelerations, need fresh forces
+            self._acc_valid = False
+    
+    def _assign_state(self, obj: PhysicsObject, name: str, value) -> None:
+        """Write an assignment to an attached object's mass or vector into the arrays."""
+        if name == 'mass':
+            mass = value if isinstance(value, Decimal) else Decimal(str(value))
+            object.__setattr__(obj, 'mass', mass)
+            self._mass[self._index[obj.name]] = self._num(mass)
+            self._acc_valid = False
+            return
+        if not isinstance(value, Vector3D):
+            raise TypeError(f"{name} must be a Vector3D")
+        vector = getattr(obj, name)
+        vector.x, vector.y, vector.z = value.x, value.y, value.z
     
     def calculate_gravitational_force(self, obj1: PhysicsObject, obj2: PhysicsObject) -> Vector3D:
         """
@@ -178,29 +484,20 @@ class DecimalPhysicsController:
         Returns:
             Force vector on obj1 due to obj2
         """
-        # Calculate displacement vector
         dx = obj2.position.x - obj1.position.x
         dy = obj2.position.y - obj1.position.y
         dz = obj2.position.z - obj1.position.z
         
-        displacement = Vector3D(dx, dy, dz)
-        distance = displacement.magnitude()
-        
-        if distance == 0:
-            raise ValueError("Objects cannot occupy the same position")
-        
-        # F = G * m1 * m2 / r^2
-        force_magnitude = (PhysicsConstants.GRAVITATIONAL_CONSTANT * 
-                          obj1.mass * obj2.mass / (distance ** 2))
-        
-        # Normalize displacement and apply force magnitude
-        direction = displacement.normalize()
-        
-        return Vector3D(
-            direction.x * force_magnitude,
-            direction.y * force_magnitude,
-            direction.z * force_magnitude
-        )
+        with localcontext() as ctx:
+            ctx.prec = _FORCE_PRECISION
+            r2 = dx * dx + dy * dy + dz * dz
+            if r2 == 0:
+                raise ValueError("Objects cannot occupy the same position")
+            
+            # F = G * m1 * m2 / r^2 along displacement / r, i.e. displacement * G*m1*m2 / r^3
+            factor = _G * obj1.mass * obj2.mass / (r2 * r2.sqrt())
+            
+            return Vector3D._from_decimals(dx * factor, dy * factor, dz * factor)
     
     def calculate_kinetic_energy(self, obj: PhysicsObject) -> Decimal:
         """
@@ -239,59 +536,279 @@ class DecimalPhysicsController:
         if distance == 0:
             raise ValueError("Objects cannot occupy the same position")
         
-        return (-PhysicsConstants.GRAVITATIONAL_CONSTANT * 
-                obj1.mass * obj2.mass / distance)
+        return -_G * obj1.mass * obj2.mass / distance
     
     def update_positions(self) -> None:
         """
         Update positions of all objects using current velocities.
         Uses simple Euler integration: x(t+dt) = x(t) + v(t)*dt
         """
-        for obj in self.objects.values():
-            obj.position.x += obj.velocity.x * self.time_step
-            obj.position.y += obj.velocity.y * self.time_step
-            obj.position.z += obj.velocity.z * self.time_step
+        self._pos += self._vel * self._dt
+        self._acc_valid = False
     
     def update_velocities(self) -> None:
         """
         Update velocities of all objects using current accelerations.
         Uses simple Euler integration: v(t+dt) = v(t) + a(t)*dt
         """
-        for obj in self.objects.values():
-            obj.velocity.x += obj.acceleration.x * self.time_step
-            obj.velocity.y += obj.acceleration.y * self.time_step
-            obj.velocity.z += obj.acceleration.z * self.time_step
+        self._vel += self._acc * self._dt
     
     def reset_accelerations(self) -> None:
         """Reset all accelerations to zero."""
-        for obj in self.objects.values():
-            obj.acceleration = Vector3D(Decimal(0), Decimal(0), Decimal(0))
+        self._acc.fill(self._num(0))
+        self._acc_valid = False
     
     def apply_forces(self) -> None:
         """
         Calculate and apply all gravitational forces between objects.
         Updates accelerations based on F = ma.
+        
+        With force_method='barnes_hut' the octree approximation is used.
+        Otherwise dispatches to the dense kernel for small float64 systems and
+        to the pair-symmetric kernel otherwise. In Decimal mode the direct
+        forces are evaluated at _FORCE_PRECISION digits.
         """
-        self.reset_accelerations()
+        n = len(self._mass)
+        
+        # Forces only need _FORCE_PRECISION digits (no effect on fast_mode floats)
+        with localcontext() as ctx:
+            ctx.prec = _FORCE_PRECISION
+            if self.force_method == 'barnes_hut':
+                acc = self._barnes_hut_accelerations()
+            elif self.fast_mode and n <= _DENSE_MAX_N:
+                acc = self._dense_accelerations()
+            else:
+                acc = self._pairwise_accelerations()
+        
+        self._acc = acc
+        self._acc_valid = True
+    
+    def _dense_accelerations(self) -> np.ndarray:
+        """
+        Compute accelerations over the full (N, N, 3) displacement tensor.
         
-        object_list = list(self.objects.values())
+        Every pair is evaluated twice, but the result is a single einsum with no
+        scatter, which is faster than the pairwise kernel for small float64 N.
+        Only used in fast_mode: einsum rejects object (Decimal) arrays on numpy
+        releases before 1.25.
         
-        for i, obj1 in enumerate(object_list):
-            for obj2 in object_list[i + 1:]:
-                # Calculate force on obj1 due to obj2
-                force = self.calculate_gravitational_force(obj1, obj2)
-                acceleration_x = force.x / obj1.mass
-                acceleration_y = force.y / obj1.mass
-                acceleration_z = force.z / obj1.mass
-                
-                obj1.acceleration.x += acceleration_x
-                obj1.acceleration.y += acceleration_y
-                obj1.acceleration.z += acceleration_z
+        Returns:
+            (N, 3) array of accelerations
+        """
+        pos = self._pos
+        n = len(self._mass)
+        diagonal = np.arange(n)
+        
+        # r[i, j] is the displacement from object i to object j
+        r = pos[np.newaxis, :, :] - pos[:, np.newaxis, :]
+        d2 = np.einsum('ijk,ijk->ij', r, r)
+        
+        # Self-interaction has zero displacement; give it a unit distance and a
+        # zero weight so it drops out of the sum
+        d2[diagonal, diagonal] = self._num(1)
+        if (d2 == 0).any():
+            raise ValueError("Objects cannot occupy the same position")
+        
+        inv_r3 = self._G / (d2 * np.sqrt(d2))
+        inv_r3[diagonal, diagonal] = self._num(0)
+        
+        return np.einsum('j,ij,ijk->ik', self._mass, inv_r3, r)
+    
+    def _pairwise_accelerations(self) -> np.ndarray:
+        """
+        Compute accelerations evaluating each unordered pair once.
+        
+        Pairs come from the upper triangle of the pair matrix. By Newton's third
+        law the pair term w = G * r_ij / |r_ij|^3 is shared: object i gains
+        m_j * w and object j loses m_i * w, so no per-object division by mass is
+        needed. Pairs are processed in chunks of _FORCE_BLOCK * N, which bounds
+        the temporaries to the same size as _FORCE_BLOCK rows of the full pair
+        matrix.
+        
+        Returns:
+            (N, 3) array of accelerations
+        """
+        pos = self._pos
+        mass = self._mass
+        n = len(mass)
+        acc = np.full((n, 3), self._num(0), dtype=self._dtype)
+        
+        first, second = self._pair_indices()
+        chunk = _FORCE_BLOCK * max(n, 1)
+        
+        for start in range(0, len(first), chunk):
+            i = first[start:start + chunk]
+            j = second[start:start + chunk]
+            
+            # Displacement from object i to object j
+            r = pos[j] - pos[i]
+            d2 = (r * r).sum(axis=1)
+            if (d2 == 0).any():
+                raise ValueError("Objects cannot occupy the same position")
+            
+            w = r * (self._G / (d2 * np.sqrt(d2)))[:, np.newaxis]
+            
+            # Equal and opposite forces
+            np.add.at(acc, i, mass[j][:, np.newaxis] * w)
+            np.subtract.at(acc, j, mass[i][:, np.newaxis] * w)
+        
+        return acc
+    
+    def apply_forces_bh(self) -> None:
+        """
+        Approximate all gravitational accelerations with a Barnes-Hut octree.
+        
+        Same as apply_forces() with ``force_method='barnes_hut'``; see
+        _barnes_hut_accelerations(). The result is reused by the next step() only
+        when the controller's force_method is 'barnes_hut'.
+        """
+        self._acc = self._barnes_hut_accelerations()
+        self._acc_valid = self.force_method == 'barnes_hut'
+    
+    def _barnes_hut_accelerations(self) -> np.ndarray:
+        """
+        Approximate accelerations with a Barnes-Hut octree.
+        
+        Bodies are grouped into octree cells, and a cell whose width w seen from
+        distance r satisfies w / r < theta is treated as a single pseudo-particle
+        at its center of mass. This reduces the cost from O(N^2) to O(N log N)
+        at the price of an approximation controlled by ``self.theta``; theta = 0
+        reproduces the direct sum.
+        
+        The tree is built and walked in float64. The walk visits each node once
+        with the whole group of bodies that opened its parent, so the per-body
+        work is vectorized and the Python overhead is O(number of nodes).
+        
+        Returns:
+            (N, 3) array of accelerations in the working number type
+        """
+        pos = np.asarray(self._pos, dtype=float)
+        mass = np.asarray(self._mass, dtype=float)
+        n = len(mass)
+        if n == 0:
+            return np.empty((0, 3), dtype=self._dtype)
+        
+        node_com, node_mass, node_center, node_half, node_bodies, node_children = (
+            self._build_octree(pos, mass)
+        )
+        node_com = np.array(node_com)
+        node_center = np.array(node_center)
+        
+        G = _G_F
+        theta = self.theta
+        acc = np.zeros((n, 3))
+        
+        # Each work item is (node, indices of the bodies that still need it)
+        stack = [(0, np.arange(n))]
+        while stack:
+            node, idx = stack.pop()
+            bodies = node_bodies[node]
+            
+            if bodies is not None:
+                # Leaves are always evaluated directly, body by body, leaving out
+                # each body's interaction with itself
+                d = pos[bodies][np.newaxis, :, :] - pos[idx][:, np.newaxis, :]
+                r2 = (d * d).sum(axis=2)
+                self_pair = idx[:, np.newaxis] == bodies[np.newaxis, :]
+                r2[self_pair] = 1.0
+                if (r2 == 0).any():
+                    raise ValueError("Objects cannot occupy the same position")
+                weight = mass[bodies] / (r2 * np.sqrt(r2))
+                weight[self_pair] = 0.0
+                acc[idx] += G * (weight[:, :, np.newaxis] * d).sum(axis=1)
+                continue
+            
+            d = node_com[node] - pos[idx]
+            r2 = (d * d).sum(axis=1)
+            r = np.sqrt(r2)
+            
+            # Cells are accepted only when far enough away and not containing the
+            # body itself; everyone else descends into the children
+            half = node_half[node]
+            outside = np.abs(pos[idx] - node_center[node]).max(axis=1) > half
+            accept = outside & (2 * half < theta * r)
+            if not accept.all():
+                opened = idx[~accept]
+                stack.extend((child, opened) for child in node_children[node])
+                idx = idx[accept]
+                d = d[accept]
+                r2 = r2[accept]
+                r = r[accept]
+                if len(idx) == 0:
+                    continue
+            
+            acc[idx] += (G * node_mass[node] / (r2 * r))[:, np.newaxis] * d
+        
+        if self.fast_mode:
+            return acc
+        return np.array(
+            [[Decimal(str(a)) for a in row] for row in acc.tolist()], dtype=object
+        )
+    
+    @staticmethod
+    def _build_octree(pos: np.ndarray, mass: np.ndarray) -> Tuple[list, list, list, list, list, list]:
+        """
+        Build a Barnes-Hut octree over the given bodies.
+        
+        Args:
+            pos: (N, 3) float64 positions
+            mass: (N,) float64 masses
+            
+        Returns:
+            Flat per-node lists (center of mass, total mass, cell center, cell
+            half-width, body index array for leaves or None, child node
+            indices); node 0 is the root. Leaves hold up to _BH_LEAF_SIZE bodies
+        """
+        node_com: list = []
+        node_mass: list = []
+        node_center: list = []
+        node_half: list = []
+        node_bodies: list = []
+        node_children: list = []
+        
+        lower = pos.min(axis=0)
+        upper = pos.max(axis=0)
+        root_half = float((upper - lower).max()) / 2 or 1.0
+        
+        def new_node() -> int:
+            node_com.append(None)
+            node_mass.append(0.0)
+            node_center.append(None)
+            node_half.append(0.0)
+            node_bodies.append(None)
+            node_children.append([])
+            return len(node_mass) - 1
+        
+        # Each work item is (node, body indices, cell center, cell half-width)
+        work = [(new_node(), np.arange(len(mass)), (lower + upper) / 2, root_half)]
+        
+        while work:
+            node, idx, center, half = work.pop()
+            m = mass[idx]
+            total = float(m.sum())
+            p = pos[idx]
+            node_mass[node] = total
+            node_center[node] = tuple(center.tolist())
+            node_half[node] = half
+            node_com[node] = tuple(((m @ p) / total if total else p.mean(axis=0)).tolist())
+            
+            if len(idx) <= _BH_LEAF_SIZE:
+                node_bodies[node] = idx
+                continue
+            if (p == p[0]).all():
+                raise ValueError("Objects cannot occupy the same position")
+            
+            # Octant code: bit 0 for x, bit 1 for y, bit 2 for z
+            upper_half = p >= center
+            octant = upper_half[:, 0] + 2 * upper_half[:, 1] + 4 * upper_half[:, 2]
+            for code in np.unique(octant).tolist():
+                child = new_node()
+                node_children[node].append(child)
                 
-                # Calculate reaction force on obj2
-                obj2.acceleration.x -= acceleration_x * obj1.mass / obj2.mass
-                obj2.acceleration.y -= acceleration_y * obj1.mass / obj2.mass
-                obj2.acceleration.z -= acceleration_z * obj1.mass / obj2.mass
+                offset = np.array([code & 1, (code >> 1) & 1, (code >> 2) & 1]) - 0.5
+                work.append((child, idx[octant == code], center + offset * half, half / 2))
+        
+        return node_com, node_mass, node_center, node_half, node_bodies, node_children
     
     def calculate_total_energy(self) -> Decimal:
         """
@@ -300,40 +817,71 @@ class DecimalPhysicsController:
         Returns:
             Total energy in Joules
         """
-        total_ke = Decimal(0)
-        total_pe = Decimal(0)
-        
-        # Kinetic energy
-        for obj in self.objects.values():
-            total_ke += self.calculate_kinetic_energy(obj)
-        
-        # Potential energy (pairwise)
-        object_list = list(self.objects.values())
-        for i, obj1 in enumerate(object_list):
-            for obj2 in object_list[i + 1:]:
-                total_pe += self.calculate_gravitational_potential_energy(obj1, obj2)
-        
-        self.total_energy = total_ke + total_pe
+        pos = self._pos
+        mass = self._mass
+        n = len(mass)
+        
+        # Kinetic energy; einsum rejects object (Decimal) arrays on numpy < 1.25
+        if self.fast_mode:
+            total_ke = 0.5 * np.einsum('i,ij,ij->', mass, self._vel, self._vel)
+        else:
+            total_ke = self._num('0.5') * (mass[:, np.newaxis] * self._vel * self._vel).sum()
+        
+        # Potential energy over all unordered pairs, chunked as in apply_forces.
+        # float64 terms are summed exactly with math.fsum to limit round-off
+        # across the O(N^2) terms.
+        total_pe = self._num(0)
+        pe_terms: List[float] = []
+        first, second = self._pair_indices()
+        chunk = _FORCE_BLOCK * max(n, 1)
+        for start in range(0, len(first), chunk):
+            i = first[start:start + chunk]
+            j = second[start:start + chunk]
+            r = pos[j] - pos[i]
+            d2 = (r * r).sum(axis=1)
+            if (d2 == 0).any():
+                raise ValueError("Objects cannot occupy the same position")
+            
+            terms = mass[i] * mass[j] / np.sqrt(d2)
+            if self.fast_mode:
+                pe_terms.extend(terms.tolist())
+            else:
+                total_pe -= self._G * terms.sum()
+        if self.fast_mode:
+            total_pe = -self._G * math.fsum(pe_terms)
+        
+        total_energy = total_ke + total_pe
+        if self.fast_mode:
+            total_energy = Decimal(str(total_energy))
+        self.total_energy = total_energy
         return self.total_energy
     
     def step(self) -> None:
         """
         Perform a single simulation step.
         
-        Order of operations:
-        1. Apply forces to calculate accelerations
-        2. Update velocities based on accelerations
-        3. Update positions based on velocities
-        4. Update current time
-        5. Record energy for monitoring
+        Uses velocity-Verlet integration, which is symplectic and second order,
+        so energy drift stays bounded for a much larger time_step than Euler:
+        1. Half-kick: v += a(t) * dt/2
+        2. Drift: x += v * dt
+        3. Apply forces to calculate a(t+dt)
+        4. Half-kick: v += a(t+dt) * dt/2
+        5. Update current time
+        6. Record energy for monitoring
+        
+        The accelerations from step 3 are reused as a(t) by the next step, so
+        there is still one force evaluation per step.
         """
+        if not self._acc_valid:
+            self.apply_forces()
+        self._vel += self._acc * self._half_dt
+        self._pos += self._vel * self._dt
         self.apply_forces()
-        self.update_velocities()
-        self.update_positions()
+        self._vel += self._acc * self._half_dt
         self.current_time += self.time_step
         self.calculate_total_energy()
     
-    def run_simulation(self, steps: int) -> List[Dict]:
+    def run_simulation(self, steps: int) -> SimulationHistory:
         """
         Run the simulation for a specified number of steps.
         
@@ -341,29 +889,38 @@ class DecimalPhysicsController:
             steps: Number of simulation steps to run
             
         Returns:
-            List of state snapshots at each step
+            SimulationHistory with the state after each step. This replaces the
+            list of snapshot dicts returned previously: len(), indexing,
+            slicing and iteration still yield those dicts, and as_dict_list()
+            builds the plain list.
         """
-        history = []
-        
-        for _ in range(steps):
+        n = len(self._object_list)
+        time_hist = np.empty(steps)
+        energy_hist = np.empty(steps)
+        pos_hist = np.empty((steps, n, 3))
+        vel_hist = np.empty_like(pos_hist)
+        acc_hist = np.empty_like(pos_hist)
+        
+        for k in range(steps):
             self.step()
             
             # Record snapshot
-            snapshot = {
-                'time': float(self.current_time),
-                'total_energy': float(self.total_energy),
-                'objects': {
-                    name: {
-                        'position': (float(obj.position.x), float(obj.position.y), float(obj.position.z)),
-                        'velocity': (float(obj.velocity.x), float(obj.velocity.y), float(obj.velocity.z)),
-                        'acceleration': (float(obj.acceleration.x), float(obj.acceleration.y), float(obj.acceleration.z))
-                    }
-                    for name, obj in self.objects.items()
-                }
-            }
-            history.append(snapshot)
+            time_hist[k] = self.current_time
+            energy_hist[k] = self.total_energy
+            pos_hist[k] = self._pos
+            vel_hist[k] = self._vel
+            acc_hist[k] = self._acc
+        
+        history = SimulationHistory(
+            names=list(self._index),
+            time=time_hist,
+            total_energy=energy_hist,
+            positions=pos_hist,
+            velocities=vel_hist,
+            accelerations=acc_hist
+        )
         
-        self.simulation_history.extend(history)
+        self.simulation_history._add_run(history)
         return history
     
     def get_object(self, name: str) -> Optional[PhysicsObject]:
@@ -405,5 +962,5 @@ class DecimalPhysicsController:
         """Reset the simulation to initial state."""
         self.current_time = Decimal(0)
         self.total_energy = Decimal(0)
-        self.simulation_history = []
+        self.simulation_history = StepHistory()
         self.reset_accelerations()
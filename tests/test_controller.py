@@ -0,0 +1,251 @@
+import importlib.util
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+# src/ is not an installed package, so load the controller module by path
+_CONTROLLER = Path(__file__).resolve().parent.parent / "src" / "core" / "controller.py"
+_spec = importlib.util.spec_from_file_location("controller", _CONTROLLER)
+controller = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = controller
+_spec.loader.exec_module(controller)
+
+DecimalPhysicsController = controller.DecimalPhysicsController
+PhysicsObject = controller.PhysicsObject
+Vector3D = controller.Vector3D
+
+
+def make_pair(fast_mode: bool = False) -> DecimalPhysicsController:
+    """A heavy body at the origin with a light body in a near-circular orbit."""
+    physics = DecimalPhysicsController(fast_mode=fast_mode)
+    physics.add_object(PhysicsObject("a", Decimal("1e10"), Vector3D(0, 0, 0)))
+    physics.add_object(PhysicsObject(
+        "b", Decimal("1e3"), Vector3D(10, 0, 0), Vector3D(0, "0.2583", 0)
+    ))
+    return physics
+
+
+class TestPhysicsObject:
+
+    def test_mass_converted_on_construction(self):
+        """A float or int mass becomes a Decimal as soon as the object exists."""
+        body = PhysicsObject("a", 2.5, Vector3D(0, 0, 0))
+
+        assert body.mass == Decimal("2.5")
+        assert isinstance(body.mass, Decimal)
+
+    def test_bad_vector_rejected_on_construction(self):
+        """A non-Vector3D position fails at construction, not in the simulation."""
+        with pytest.raises(TypeError, match="position"):
+            PhysicsObject("a", 1, (0, 0, 0))
+
+    def test_reassigned_field_checked_on_add(self):
+        """Fields reassigned after construction are checked by add_object()."""
+        body = PhysicsObject("a", 1, Vector3D(0, 0, 0))
+        body.velocity = [1, 0, 0]
+
+        with pytest.raises(TypeError, match="velocity"):
+            DecimalPhysicsController().add_object(body)
+
+
+@pytest.mark.parametrize("fast_mode", [False, True])
+class TestObjectState:
+
+    def test_objects_follow_steps(self, fast_mode):
+        """objects[...] and get_object() show the same, current state."""
+        physics = make_pair(fast_mode)
+        for _ in range(3):
+            physics.step()
+
+        assert physics.objects["a"].position.x != 0
+        assert physics.objects["a"].position == physics.get_object("a").position
+
+    def test_caller_edits_are_used(self, fast_mode):
+        """Changing a PhysicsObject between steps changes the simulation."""
+        physics = make_pair(fast_mode)
+        body = physics.objects["a"]
+        physics.step()
+
+        body.velocity = Vector3D(100, 0, 0)
+        physics.step()
+
+        assert body.position.x > Decimal("0.99")
+        assert body.velocity.x > Decimal("99")
+
+    def test_caller_acceleration_is_used(self, fast_mode):
+        """An assigned acceleration drives update_velocities() like any other edit."""
+        physics = make_pair(fast_mode)
+        body = physics.objects["b"]
+        body.acceleration = Vector3D(1, 0, 0)
+        physics.update_velocities()
+
+        assert body.velocity.x == Decimal("0.01")
+
+    def test_held_vector_references_stay_live(self, fast_mode):
+        """Vector3D references taken before a step show the state after it."""
+        physics = make_pair(fast_mode)
+        position = physics.objects["b"].position
+        velocity = physics.objects["b"].velocity
+        physics.update_positions()
+
+        assert position.y == Decimal("0.002583")
+        physics.step()
+        assert position == physics.get_object("b").position
+        assert velocity == physics.get_object("b").velocity
+
+    def test_removed_object_keeps_its_state(self, fast_mode):
+        """remove_object() leaves the object with its last state, detached."""
+        physics = make_pair(fast_mode)
+        body = physics.objects["b"]
+        position = body.position
+        physics.step()
+        last = Vector3D(position.x, position.y, position.z)
+        physics.remove_object("b")
+        physics.step()
+
+        assert position == last
+        body.velocity = Vector3D(1, 2, 3)
+        assert body.velocity == Vector3D(1, 2, 3)
+        assert physics.get_object("a").velocity.y != 2
+
+
+class TestSimulationHistory:
+
+    def setup_method(self):
+        """Two runs of different lengths on the same controller."""
+        self.physics = make_pair()
+        self.first = self.physics.run_simulation(3)
+        self.second = self.physics.run_simulation(2)
+
+    def test_history_is_step_indexed(self):
+        """simulation_history counts steps across runs, not runs."""
+        history = self.physics.simulation_history
+
+        assert len(history) == 5
+        assert history[-1]["time"] == float(self.physics.current_time)
+        assert history[3] == self.second[0]
+        assert history[1:3] == [self.first[1], self.first[2]]
+        assert [snapshot["time"] for snapshot in history] == pytest.approx(
+            [0.01, 0.02, 0.03, 0.04, 0.05]
+        )
+
+    def test_run_supports_slicing(self):
+        """A run slices like the list of snapshot dicts it replaces."""
+        snapshots = self.first.as_dict_list()
+
+        assert self.first[1:] == snapshots[1:]
+        assert self.first[::-2] == snapshots[::-2]
+        assert self.first[-1] == snapshots[-1]
+
+    def test_runs_compare_by_identity(self):
+        """Comparing two runs must not raise on their array fields."""
+        assert self.first == self.first
+        assert self.first != self.second
+
+
+def make_cluster(n: int = 40, fast_mode: bool = False, **kwargs) -> DecimalPhysicsController:
+    """n bodies at fixed pseudo-random positions, enough to build a real octree."""
+    physics = DecimalPhysicsController(fast_mode=fast_mode, **kwargs)
+    for i in range(n):
+        position = Vector3D(*((i * k * 7919) % 1000 - 500 + k for k in (1, 3, 7)))
+        physics.add_object(PhysicsObject(f"body{i}", Decimal(1000 + i * 37), position))
+    return physics
+
+
+@pytest.mark.parametrize("fast_mode", [False, True])
+class TestBarnesHut:
+
+    def test_theta_zero_matches_direct_forces(self, fast_mode):
+        """With theta = 0 no cell is approximated, so the direct sum is reproduced."""
+        direct = make_cluster(fast_mode=fast_mode)
+        direct.apply_forces()
+        tree = make_cluster(fast_mode=fast_mode)
+        tree.theta = 0.0
+        tree.apply_forces_bh()
+
+        expected = direct._acc.astype(float)
+        tolerance = 1e-12 * abs(expected).max()
+        assert tree._acc.astype(float) == pytest.approx(expected, rel=1e-12, abs=tolerance)
+
+    def test_step_uses_barnes_hut(self, fast_mode):
+        """force_method='barnes_hut' is honoured by step(), not thrown away."""
+        direct = make_cluster(fast_mode=fast_mode)
+        tree = make_cluster(fast_mode=fast_mode, force_method="barnes_hut")
+        tree.theta = 0.0
+        for _ in range(3):
+            direct.step()
+            tree.step()
+
+        assert tree._pos.astype(float) == pytest.approx(direct._pos.astype(float), rel=1e-12)
+        assert float(tree.total_energy) == pytest.approx(float(direct.total_energy), rel=1e-12)
+
+
+def test_pair_indices_cached_per_object_count():
+    """The pair index arrays are reused, and rebuilt when objects change."""
+    physics = make_cluster(n=5)
+    pairs = physics._pair_indices()
+
+    assert physics._pair_indices() is pairs
+    assert len(pairs[0]) == 10
+    physics.remove_object("body0")
+    assert len(physics._pair_indices()[0]) == 6
+    physics.add_object(PhysicsObject("extra", Decimal(1), Vector3D(1, 2, 3)))
+    assert len(physics._pair_indices()[0]) == 10
+
+
+def test_unknown_force_method_rejected():
+    """Only the documented force methods are accepted."""
+    with pytest.raises(ValueError):
+        DecimalPhysicsController(force_method="fmm")
+
+
+def test_reduced_force_precision(monkeypatch):
+    """Forces at _FORCE_PRECISION digits agree with full-precision forces."""
+    reduced = make_cluster()
+    reduced.apply_forces()
+    monkeypatch.setattr(controller, "_FORCE_PRECISION", 50)
+    full = make_cluster()
+    full.apply_forces()
+
+    error = max(abs(a - b) / abs(b) for a, b in zip(reduced._acc.flat, full._acc.flat))
+    assert error < Decimal("1e-22")
+
+
+def relative_energy_drift(physics: DecimalPhysicsController, steps: int) -> float:
+    """Largest |E - E0| / |E0| seen over steps velocity-Verlet steps."""
+    initial = float(physics.calculate_total_energy())
+    history = physics.run_simulation(steps)
+    return float(abs(history.total_energy - initial).max() / abs(initial))
+
+
+class TestIntegration:
+
+    def test_fast_mode_matches_decimal(self):
+        """The float64 fast path follows the Decimal reference trajectory."""
+        reference = make_cluster(fast_mode=False)
+        fast = make_cluster(fast_mode=True)
+        reference.run_simulation(20)
+        fast.run_simulation(20)
+
+        assert fast._pos == pytest.approx(reference._pos.astype(float), rel=1e-12)
+        assert float(fast.total_energy) == pytest.approx(float(reference.total_energy), rel=1e-12)
+
+    def test_verlet_energy_drift_is_bounded(self):
+        """Velocity Verlet keeps the energy error small and far below Euler's."""
+        verlet = make_pair()
+        verlet.time_step = Decimal("0.1")
+        drift = relative_energy_drift(verlet, 500)
+
+        euler = make_pair()
+        euler.time_step = Decimal("0.1")
+        initial = euler.calculate_total_energy()
+        for _ in range(500):
+            euler.apply_forces()
+            euler.update_velocities()
+            euler.update_positions()
+        euler_drift = float(abs((euler.calculate_total_energy() - initial) / initial))
+
+        assert drift < 1e-8
+        assert drift * 100 < euler_drift
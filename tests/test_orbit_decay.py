@@ -0,0 +1,178 @@
+import importlib.util
+import math
+from decimal import Decimal, localcontext
+from pathlib import Path
+
+import pytest
+
+# The example's file name starts with a digit, so load it by path
+_EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "01_orbit_decay.py"
+_spec = importlib.util.spec_from_file_location("orbit_decay", _EXAMPLE)
+orbit_decay = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(orbit_decay)
+
+ALTITUDE_KM = 400.0
+CIRCULAR_VELOCITY = math.sqrt(orbit_decay.EARTH_GM / (orbit_decay.EARTH_RADIUS_KM + ALTITUDE_KM))
+
+
+class TestAdaptiveIntegrator:
+
+    def setup_method(self):
+        """Start from the example's own initial state."""
+        self.sim = orbit_decay.OrbitalSimulator(ALTITUDE_KM, CIRCULAR_VELOCITY)
+
+    def test_advance_adaptive_finishes(self):
+        """A well-behaved stretch ends exactly at the requested time."""
+        n_steps = self.sim.advance_adaptive(3600.0)
+
+        assert self.sim.time == 3600.0
+        assert 0 < n_steps < 1000
+        assert self.sim.distance > 0
+
+    def test_step_size_collapse_raises(self):
+        """Reaching r = 0 must raise instead of shrinking dt forever."""
+        with pytest.raises(RuntimeError, match="dt_min"):
+            self.sim.advance_adaptive(7200.0)
+
+
+class TestDecimalBackends:
+
+    @pytest.mark.filterwarnings("ignore:mpmath is running without gmpy2")
+    def test_mpmath_backend_at_low_precision(self):
+        """backend='mpmath' is honoured even where Decimal would use floats."""
+        pytest.importorskip("mpmath")
+        sim = orbit_decay.DecimalOrbitalSimulator("400", "7.6686", precision=16,
+                                                  backend="mpmath")
+        sim.step()
+
+        assert not sim.use_compensated
+        assert isinstance(sim.distance, sim._mp.mpf)
+
+    def test_missing_gmpy2_warning_points_at_caller(self, monkeypatch):
+        """The slow-backend warning is attributed to the constructor call."""
+        mpmath = pytest.importorskip("mpmath")
+        monkeypatch.setattr(mpmath.libmp, "BACKEND", "python")
+        with pytest.warns(RuntimeWarning, match="gmpy2") as record:
+            orbit_decay.DecimalOrbitalSimulator("400", "7.6686", backend="mpmath")
+
+        assert record[0].filename == __file__
+
+    @pytest.mark.filterwarnings("ignore:mpmath is running without gmpy2")
+    def test_mpmath_matches_decimal(self):
+        """The mpmath backend agrees with Decimal at the same precision."""
+        pytest.importorskip("mpmath")
+        mp_sim = run_decimal_hour(precision=50, backend="mpmath")
+        reference = run_decimal_hour(precision=50)
+
+        error = abs(Decimal(str(mp_sim.distance)) - reference.distance) / reference.distance
+        assert error < Decimal("1e-40")
+
+
+def run_decimal_hour(**kwargs):
+    """Advance a DecimalOrbitalSimulator for one hour of 10 s Euler steps."""
+    sim = orbit_decay.DecimalOrbitalSimulator("400", str(CIRCULAR_VELOCITY), **kwargs)
+    for _ in range(360):
+        sim.step()
+    return sim
+
+
+class TestCompensatedPath:
+
+    def test_compensated_is_opt_in(self):
+        """Low precision alone keeps the simulator on Decimal arithmetic."""
+        sim = orbit_decay.DecimalOrbitalSimulator("400", "7.6686", precision=16)
+
+        assert not sim.use_compensated
+        assert isinstance(sim.distance, Decimal)
+
+    def test_compensated_matches_decimal(self):
+        """The Kahan-compensated float64 path tracks 50-digit Decimal."""
+        compensated = run_decimal_hour(precision=16, use_compensated=True)
+        reference = run_decimal_hour(precision=50)
+
+        assert compensated.use_compensated
+        assert compensated.distance == pytest.approx(float(reference.distance), rel=1e-14)
+
+
+def energy_error(sim) -> float:
+    """Relative energy error after one hour at the integrator's default time step."""
+    initial = sim.total_energy
+    dt = orbit_decay.DEFAULT_TIME_STEPS[sim.integrator]
+    sim.advance(dt, int(3600 / dt))
+    return abs((sim.total_energy - initial) / initial)
+
+
+class TestFixedStepIntegrators:
+
+    def test_higher_order_integrators_beat_euler(self):
+        """RK4 and leapfrog conserve energy better than Euler at larger steps."""
+        errors = {
+            name: energy_error(orbit_decay.OrbitalSimulator(ALTITUDE_KM, CIRCULAR_VELOCITY,
+                                                            integrator=name))
+            for name in orbit_decay.INTEGRATORS
+        }
+
+        assert errors["rk4"] < errors["euler"] / 1000
+        assert errors["leapfrog"] < errors["euler"] / 5
+
+    def test_rk4_matches_adaptive_reference(self):
+        """RK4 and a tight Dormand-Prince run land on the same trajectory."""
+        rk4 = orbit_decay.OrbitalSimulator(ALTITUDE_KM, CIRCULAR_VELOCITY, integrator="rk4")
+        rk4.advance(60.0, 60)
+        reference = orbit_decay.OrbitalSimulator(ALTITUDE_KM, CIRCULAR_VELOCITY)
+        reference.advance_adaptive(3600.0, tol=1e-12)
+
+        assert rk4.distance == pytest.approx(reference.distance, rel=1e-4)
+
+    def test_unknown_integrator_rejected(self):
+        """Only the registered integrators are accepted."""
+        with pytest.raises(ValueError):
+            orbit_decay.OrbitalSimulator(ALTITUDE_KM, CIRCULAR_VELOCITY, integrator="verlet")
+
+
+def test_batch_matches_individual_simulators():
+    """run_simulation_batch advances each altitude like its own Euler simulator."""
+    altitudes = [300.0, 400.0, 550.0]
+    batch = orbit_decay.run_simulation_batch(altitudes, duration_hours=2)
+
+    assert len(batch) == 3
+    for i, altitude in enumerate(altitudes):
+        velocity = math.sqrt(orbit_decay.EARTH_GM / (orbit_decay.EARTH_RADIUS_KM + altitude))
+        sim = orbit_decay.OrbitalSimulator(altitude, velocity)
+        assert batch[0]["velocity"][i] == pytest.approx(velocity, rel=1e-15)
+        sim.advance(orbit_decay.DEFAULT_TIME_STEPS["euler"], 720)
+        assert batch[-1]["distance"][i] == pytest.approx(sim.distance, rel=1e-12)
+        assert batch[-1]["energy"][i] == pytest.approx(sim.total_energy, rel=1e-12)
+
+
+def test_step_dt_sets_the_decimal_time_step():
+    """step() advances by step_dt using the prebuilt Decimal constants."""
+    sim = orbit_decay.DecimalOrbitalSimulator("400", "7.6686", step_dt="5")
+    distance, velocity = sim.distance, sim.velocity
+    sim.step()
+    sim.step()
+
+    assert sim.time == Decimal("10")
+    with localcontext() as ctx:
+        ctx.prec = 50
+        for _ in range(2):
+            accel = -sim.DRAG_COEFFICIENT * velocity * velocity - sim.GM / (distance * distance)
+            velocity += accel * 5
+            distance += velocity * 5
+    assert abs(sim.distance - distance) < Decimal("1e-44")
+    assert abs(sim.velocity - velocity) < Decimal("1e-44")
+
+
+def test_get_state_cache_refreshes_after_step():
+    """The cached get_state snapshot is rebuilt after step() and never shared."""
+    sim = orbit_decay.DecimalOrbitalSimulator("400", "7.6686")
+    before = sim.get_state()
+    before["altitude"] = -1.0
+
+    assert sim.get_state()["altitude"] == pytest.approx(400.0)
+    sim.step()
+    after = sim.get_state()
+    assert after["time"] == 10.0
+    assert after["distance"] == float(sim.distance)
+    assert after["energy"] == float(sim.total_energy)
+
@@ -0,0 +1,80 @@
+import importlib.util
+from pathlib import Path
+
+_CHECKLIST = Path(__file__).resolve().parent.parent / "validation_checklist.py"
+_spec = importlib.util.spec_from_file_location("validation_checklist", _CHECKLIST)
+validation_checklist = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validation_checklist)
+
+SECTIONS = (
+    "check_environment_and_dependencies",
+    "check_package_structure",
+    "check_package_import_and_instantiation",
+    "check_core_functionality",
+    "check_license_validation",
+    "check_readme_validation",
+    "check_pytest_execution",
+    "check_example_scripts",
+)
+
+
+def make_checklist():
+    """A checklist whose pytest section is stubbed out, so it cannot run this suite again."""
+    checklist = validation_checklist.ValidationChecklist()
+    checklist.check_pytest_execution = lambda: True
+    return checklist
+
+
+def test_parallel_run_matches_sequential(capsys):
+    """Sections run in parallel report the same output and results as in order."""
+    parallel = make_checklist()
+    parallel_code = parallel.run_all_checks()
+    parallel_output = capsys.readouterr().out
+
+    sequential = make_checklist()
+    for section in SECTIONS:
+        getattr(sequential, section)()
+    sequential_code = sequential.print_summary()
+    sequential_output = capsys.readouterr().out
+
+    assert parallel_output.endswith(sequential_output)
+    assert parallel.results == sequential.results
+    assert parallel.failed_checks == sequential.failed_checks
+    assert parallel_code == sequential_code
+
+
+def test_readme_sections_found_in_one_scan(tmp_path):
+    """Overlapping, mixed-case keywords each count toward their own section."""
+    (tmp_path / "README.md").write_text(
+        "Decimal physics. " * 10 + "\n## INSTALLATION\nSee the Quick Start. Licensed under MIT.\n"
+    )
+    checklist = validation_checklist.ValidationChecklist()
+    checklist._root_entries = checklist._scan_dir(str(tmp_path))
+
+    assert checklist.check_readme_validation()
+    assert all(result["passed"] for result in checklist.results["README Validation"].values())
+
+    (tmp_path / "README.md").write_text("Decimal physics. " * 10 + "\nUsage: import it.\n")
+    checklist = validation_checklist.ValidationChecklist()
+    checklist._root_entries = checklist._scan_dir(str(tmp_path))
+
+    assert not checklist.check_readme_validation()
+    assert checklist.failed_checks == [
+        ("README Validation", "README has installation"),
+        ("README Validation", "README has license"),
+    ]
+
+
+def test_section_counts_follow_recorded_results():
+    """Re-recording a check replaces its result in the section's pass count."""
+    checklist = validation_checklist.ValidationChecklist()
+    checklist.record_result("Demo", "first", True)
+    checklist.record_result("Demo", "second", False)
+    assert checklist._section_counts["Demo"] == [1, 2]
+
+    checklist.record_result("Demo", "second", True)
+    assert checklist._section_counts["Demo"] == [2, 2]
+    checklist.record_result("Demo", "first", False)
+    assert checklist._section_counts["Demo"] == [1, 2]
+    checklist.record_result("Demo", "first", False)
+    assert checklist._section_counts["Demo"] == [1, 2]
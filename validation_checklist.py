@@ -14,56 +14,149 @@ Exit codes:
     1 - One or more validations failed
 """
 
+import ast
 import os
 import sys
 import subprocess
 import importlib.util
 import json
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Callable, Deque, Optional
+
+try:
+    from importlib.metadata import PackageNotFoundError, version as package_version
+except ImportError:  # Python 3.7
+    package_version = None
+
+
+# README sections and the keywords that count as evidence for each. One
+# case-insensitive pattern finds every keyword in a single pass over the text;
+# like the substring test it replaces, it also matches inside longer words
+# (e.g. "installation", "examples"). The lookahead lets overlapping keywords
+# from different sections both match.
+README_SECTIONS = {
+    "installation": ["install", "setup", "requirements"],
+    "usage": ["usage", "example", "quick start"],
+    "license": ["license", "licensed"]
+}
+_README_KEYWORD_SECTION = {
+    keyword: section_name
+    for section_name, keywords in README_SECTIONS.items()
+    for keyword in keywords
+}
+_README_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _README_KEYWORD_SECTION) + "))",
+    re.IGNORECASE
+)
 
 
 class ValidationChecklist:
     """Comprehensive pre-deployment validation for decimal-physics-controller."""
 
+    _RESET = "\033[0m"
+    _PASS_PREFIX = "\033[92m✓"
+    _FAIL_PREFIX = "\033[91m✗"
+    STATUS_FORMAT = {"PASS": _PASS_PREFIX, "FAIL": _FAIL_PREFIX}
+
     def __init__(self):
         """Initialize the validation checklist."""
         self.repo_root = Path(__file__).parent
+        self._root_str = os.fspath(self.repo_root)
+        self._path_cache: Dict[str, str] = {}
         self.results: Dict[str, Dict[str, Any]] = {}
-        self.failed_checks = []
-        self.passed_checks = []
+        self.failed_checks: List[Tuple[str, str]] = []
+        self.passed_checks: List[Tuple[str, str]] = []
+        
+        # [passed, total] per section, kept up to date by record_result
+        self._section_counts: Dict[str, List[int]] = {}
+        
+        # Per-thread output and result buffers while sections run in parallel
+        self._local = threading.local()
+        
+        # Package module imported by section 3, reused by later sections
+        self._imported_pkg = None
+        
+        # One directory listing each for the repo root and the package, reused by
+        # the existence checks instead of a stat() per path
+        self._root_entries = self._scan_dir(self._root_str)
+        self._package_entries = self._scan_dir(self._resolve("decimal_physics_controller"))
+
+    def _resolve(self, rel: str) -> str:
+        """Return the absolute path string for a repo-relative path, built once per path."""
+        path = self._path_cache.get(rel)
+        if path is None:
+            path = self._path_cache[rel] = os.path.join(self._root_str, rel)
+        return path
+
+    @staticmethod
+    def _scan_dir(path: str) -> Dict[str, os.DirEntry]:
+        """Map entry names to DirEntry objects for a directory (empty if missing)."""
+        try:
+            with os.scandir(path) as entries:
+                return {entry.name: entry for entry in entries}
+        except OSError:
+            return {}
+
+    def _print(self, text: str = "") -> None:
+        """Print a line, or buffer it when called from a parallel section."""
+        output = getattr(self._local, "output", None)
+        if output is None:
+            print(text)
+        else:
+            output.append(text)
+
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write a block of lines to stdout in one call and flush it."""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
     def print_header(self, title: str) -> None:
         """Print a formatted section header."""
-        print("\n" + "=" * 80)
-        print(f"  {title}")
-        print("=" * 80)
+        self._print("\n" + "=" * 80)
+        self._print(f"  {title}")
+        self._print("=" * 80)
 
     def print_check(self, name: str, status: str, message: str = "") -> None:
         """Print a validation check result."""
-        status_symbol = "✓" if status == "PASS" else "✗"
-        color_code = "\033[92m" if status == "PASS" else "\033[91m"
-        reset_code = "\033[0m"
-        
-        print(f"{color_code}{status_symbol} {name}: {status}{reset_code}")
+        prefix = self.STATUS_FORMAT.get(status, self._FAIL_PREFIX)
+        self._print(f"{prefix} {name}: {status}{self._RESET}")
         if message:
-            print(f"  {message}")
+            self._print(f"  {message}")
 
     def record_result(self, section: str, check_name: str, passed: bool, 
                      message: str = "") -> None:
         """Record a validation result."""
-        if section not in self.results:
-            self.results[section] = {}
+        records = getattr(self._local, "records", None)
+        if records is not None:
+            records.append((section, check_name, passed, message))
+            return
         
-        self.results[section][check_name] = {
+        section_results = self.results.setdefault(section, {})
+        previous = section_results.get(check_name)
+        section_results[check_name] = {
             "passed": passed,
             "message": message
         }
         
+        counts = self._section_counts.setdefault(section, [0, 0])
+        if previous is None:
+            counts[1] += 1
+        elif previous["passed"]:
+            counts[0] -= 1
         if passed:
-            self.passed_checks.append(f"{section}::{check_name}")
+            counts[0] += 1
+        
+        # (section, check_name) pairs; formatted only when the summary prints them
+        if passed:
+            self.passed_checks.append((section, check_name))
         else:
-            self.failed_checks.append(f"{section}::{check_name}")
+            self.failed_checks.append((section, check_name))
 
     # =========================================================================
     # SECTION 1: Environment and Dependencies Check
@@ -96,8 +189,8 @@ class ValidationChecklist:
         ]
         
         for req_file in required_files:
-            file_path = self.repo_root / req_file
-            exists = file_path.exists()
+            entry = self._root_entries.get(req_file)
+            exists = entry is not None and entry.is_file()
             self.print_check(
                 f"{req_file} exists",
                 "PASS" if exists else "FAIL"
@@ -109,8 +202,8 @@ class ValidationChecklist:
         required_dirs = ["decimal_physics_controller", "tests"]
         
         for req_dir in required_dirs:
-            dir_path = self.repo_root / req_dir
-            exists = dir_path.is_dir()
+            entry = self._root_entries.get(req_dir)
+            exists = entry is not None and entry.is_dir()
             self.print_check(
                 f"Directory '{req_dir}' exists",
                 "PASS" if exists else "FAIL"
@@ -119,8 +212,8 @@ class ValidationChecklist:
             all_passed = all_passed and exists
 
         # Check for __init__.py in package
-        init_path = self.repo_root / "decimal_physics_controller" / "__init__.py"
-        init_exists = init_path.exists()
+        init_entry = self._package_entries.get("__init__.py")
+        init_exists = init_entry is not None and init_entry.is_file()
         self.print_check(
             "Package __init__.py exists",
             "PASS" if init_exists else "FAIL"
@@ -141,9 +234,9 @@ class ValidationChecklist:
         all_passed = True
         section = "Package Structure"
 
-        package_root = self.repo_root / "decimal_physics_controller"
+        package_entry = self._root_entries.get("decimal_physics_controller")
         
-        if not package_root.is_dir():
+        if package_entry is None or not package_entry.is_dir():
             self.print_check("Package directory found", "FAIL")
             self.record_result(section, "Package directory found", False)
             return False
@@ -154,8 +247,8 @@ class ValidationChecklist:
         ]
         
         for module in essential_modules:
-            module_path = package_root / module
-            exists = module_path.exists()
+            entry = self._package_entries.get(module)
+            exists = entry is not None and entry.is_file()
             self.print_check(
                 f"Module '{module}' exists",
                 "PASS" if exists else "FAIL"
@@ -164,20 +257,23 @@ class ValidationChecklist:
             all_passed = all_passed and exists
 
         # List all Python files in package
-        py_files = list(package_root.glob("*.py"))
+        py_files = [
+            entry.name for entry in self._package_entries.values()
+            if entry.is_file() and entry.name.endswith(".py")
+        ]
         py_count = len(py_files)
         
         self.print_check(
             f"Python modules found in package",
             "PASS" if py_count > 0 else "FAIL",
-            f"Found {py_count} Python files: {', '.join(f.name for f in py_files)}"
+            f"Found {py_count} Python files: {', '.join(py_files)}"
         )
         self.record_result(section, "Python modules found", py_count > 0, str(py_count))
         all_passed = all_passed and (py_count > 0)
 
         # Check for tests directory
-        tests_dir = self.repo_root / "tests"
-        tests_exist = tests_dir.is_dir()
+        tests_entry = self._root_entries.get("tests")
+        tests_exist = tests_entry is not None and tests_entry.is_dir()
         
         self.print_check(
             "Tests directory exists",
@@ -187,7 +283,10 @@ class ValidationChecklist:
         all_passed = all_passed and tests_exist
 
         if tests_exist:
-            test_files = list(tests_dir.glob("test_*.py"))
+            test_files = [
+                entry for entry in self._scan_dir(tests_entry.path).values()
+                if entry.name.startswith("test_") and entry.name.endswith(".py")
+            ]
             test_count = len(test_files)
             
             self.print_check(
@@ -211,12 +310,14 @@ class ValidationChecklist:
         all_passed = True
         section = "Package Import"
 
-        # Add package to path
-        sys.path.insert(0, str(self.repo_root))
+        # Add package to path (once, so repeated runs don't grow sys.path)
+        if not sys.path or sys.path[0] != self._root_str:
+            sys.path.insert(0, self._root_str)
 
         # Attempt to import main package
         try:
             import decimal_physics_controller
+            self._imported_pkg = decimal_physics_controller
             self.print_check("Import decimal_physics_controller", "PASS")
             self.record_result(section, "Import main package", True)
         except Exception as e:
@@ -284,13 +385,15 @@ class ValidationChecklist:
         section = "Core Functionality"
 
         try:
-            import decimal_physics_controller
-            
-            # Check for main classes/functions
-            main_exports = dir(decimal_physics_controller)
+            pkg = self._imported_pkg
+            if pkg is None:
+                import decimal_physics_controller as pkg
             
-            # Remove private/magic attributes
-            public_exports = [x for x in main_exports if not x.startswith('_')]
+            # Check for main classes/functions: a declared __all__ is already the
+            # public API, otherwise filter private/magic attributes out of dir()
+            public_exports = list(getattr(pkg, "__all__", None) or [
+                x for x in dir(pkg) if not x.startswith('_')
+            ])
             
             self.print_check(
                 "Public API available",
@@ -305,9 +408,9 @@ class ValidationChecklist:
             )
             
             if public_exports:
-                print(f"  Available: {', '.join(public_exports[:10])}")
+                self._print(f"  Available: {', '.join(public_exports[:10])}")
                 if len(public_exports) > 10:
-                    print(f"  ... and {len(public_exports) - 10} more")
+                    self._print(f"  ... and {len(public_exports) - 10} more")
 
         except Exception as e:
             self.print_check(
@@ -331,9 +434,9 @@ class ValidationChecklist:
         all_passed = True
         section = "License Validation"
 
-        license_path = self.repo_root / "LICENSE"
+        license_entry = self._root_entries.get("LICENSE")
         
-        if not license_path.exists():
+        if license_entry is None or not license_entry.is_file():
             self.print_check(
                 "LICENSE file exists",
                 "FAIL"
@@ -347,16 +450,15 @@ class ValidationChecklist:
         )
         self.record_result(section, "LICENSE file exists", True)
 
-        # Check license file is not empty
+        # Check license file is not empty; only its size matters, so don't read it
         try:
-            with open(license_path, 'r') as f:
-                content = f.read().strip()
-                
-            is_valid = len(content) > 0
+            size = license_entry.stat().st_size
+            
+            is_valid = size > 0
             self.print_check(
                 "LICENSE file is not empty",
                 "PASS" if is_valid else "FAIL",
-                f"License size: {len(content)} bytes"
+                f"License size: {size} bytes"
             )
             self.record_result(section, "LICENSE file is not empty", is_valid)
             all_passed = all_passed and is_valid
@@ -383,9 +485,9 @@ class ValidationChecklist:
         all_passed = True
         section = "README Validation"
 
-        readme_path = self.repo_root / "README.md"
+        readme_entry = self._root_entries.get("README.md")
         
-        if not readme_path.exists():
+        if readme_entry is None or not readme_entry.is_file():
             self.print_check(
                 "README.md file exists",
                 "FAIL"
@@ -401,7 +503,7 @@ class ValidationChecklist:
 
         # Check README is not empty
         try:
-            with open(readme_path, 'r') as f:
+            with open(readme_entry.path, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read().strip()
                 
             is_valid = len(content) > 100  # Minimum reasonable length
@@ -413,17 +515,15 @@ class ValidationChecklist:
             self.record_result(section, "README.md has content", is_valid)
             all_passed = all_passed and is_valid
 
-            # Check for common sections
-            required_sections = {
-                "installation": ["install", "setup", "requirements"],
-                "usage": ["usage", "example", "quick start"],
-                "license": ["license", "licensed"]
-            }
-
-            content_lower = content.lower()
+            # Check for common sections in one scan of the README
+            found_sections = set()
+            for match in _README_KEYWORD_RE.finditer(content):
+                found_sections.add(_README_KEYWORD_SECTION[match.group(1).lower()])
+                if len(found_sections) == len(README_SECTIONS):
+                    break
             
-            for section_name, keywords in required_sections.items():
-                found = any(keyword in content_lower for keyword in keywords)
+            for section_name in README_SECTIONS:
+                found = section_name in found_sections
                 status = "PASS" if found else "FAIL"
                 self.print_check(
                     f"README includes '{section_name}' section",
@@ -457,9 +557,9 @@ class ValidationChecklist:
         
         section = "Pytest Execution"
 
-        tests_dir = self.repo_root / "tests"
+        tests_dir = self._resolve("tests")
         
-        if not tests_dir.exists():
+        if not os.path.isdir(tests_dir):
             self.print_check(
                 "Tests directory found",
                 "FAIL"
@@ -467,61 +567,63 @@ class ValidationChecklist:
             self.record_result(section, "Tests directory found", False)
             return False
 
-        # Check if pytest is available
-        try:
-            result = subprocess.run(
-                ["python", "-m", "pytest", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
+        # Check if pytest is available without starting another interpreter
+        self._pytest_available = importlib.util.find_spec("pytest") is not None
+        
+        if self._pytest_available:
+            version = "pytest"
+            if package_version is not None:
+                try:
+                    version = f"pytest {package_version('pytest')}"
+                except PackageNotFoundError:
+                    pass
+            self.print_check(
+                "pytest is installed",
+                "PASS",
+                version
             )
-            
-            if result.returncode == 0:
-                self.print_check(
-                    "pytest is installed",
-                    "PASS",
-                    result.stdout.strip()
-                )
-                self.record_result(section, "pytest installed", True)
-            else:
-                self.print_check(
-                    "pytest is installed",
-                    "FAIL",
-                    "pytest not found. Install with: pip install pytest"
-                )
-                self.record_result(section, "pytest installed", False)
-                return False
-
-        except Exception as e:
+            self.record_result(section, "pytest installed", True)
+        else:
             self.print_check(
                 "pytest is installed",
                 "FAIL",
-                f"Error checking pytest: {str(e)}"
+                "pytest not found. Install with: pip install pytest"
             )
-            self.record_result(section, "pytest installed", False, str(e))
+            self.record_result(section, "pytest installed", False)
             return False
 
-        # Run pytest
+        # Run pytest, keeping only the tail of its output as it streams
+        tail: Deque[str] = deque(maxlen=20)  # Last 20 lines to avoid spam
         try:
-            result = subprocess.run(
-                ["python", "-m", "pytest", str(tests_dir), "-v", "--tb=short"],
-                capture_output=True,
+            with subprocess.Popen(
+                [sys.executable, "-m", "pytest", tests_dir, "-v", "--tb=short"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                cwd=str(self.repo_root),
-                timeout=60
-            )
+                bufsize=1,
+                cwd=self._root_str
+            ) as proc:
+                reader = threading.Thread(target=tail.extend, args=(proc.stdout,), daemon=True)
+                reader.start()
+                try:
+                    returncode = proc.wait(timeout=60)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    raise
+                finally:
+                    reader.join()
             
             # Parse output
-            passed = result.returncode == 0
+            passed = returncode == 0
             
             self.print_check(
                 "All tests passed",
                 "PASS" if passed else "FAIL"
             )
             
-            if result.stdout:
-                print("\nTest output:")
-                print(result.stdout[-1000:])  # Last 1000 chars to avoid spam
+            if tail:
+                self._print("\nTest output:")
+                self._print("".join(tail))
             
             self.record_result(section, "All tests passed", passed)
             return passed
@@ -556,14 +658,14 @@ class ValidationChecklist:
 
         # Look for examples directory or files
         examples_locations = [
-            self.repo_root / "examples",
-            self.repo_root / "example",
-            self.repo_root / "docs" / "examples"
+            "examples",
+            "example",
+            os.path.join("docs", "examples")
         ]
         
         examples_dir = None
         for location in examples_locations:
-            if location.is_dir():
+            if os.path.isdir(self._resolve(location)):
                 examples_dir = location
                 break
 
@@ -571,12 +673,15 @@ class ValidationChecklist:
             self.print_check(
                 "Examples directory found",
                 "PASS",
-                f"Location: {examples_dir.relative_to(self.repo_root)}"
+                f"Location: {examples_dir}"
             )
             self.record_result(section, "Examples directory found", True)
 
             # Check for example Python files
-            example_files = list(examples_dir.glob("*.py"))
+            example_files = [
+                entry for entry in self._scan_dir(self._resolve(examples_dir)).values()
+                if entry.is_file() and entry.name.endswith(".py")
+            ]
             
             if example_files:
                 self.print_check(
@@ -586,12 +691,15 @@ class ValidationChecklist:
                 )
                 self.record_result(section, "Example files found", True)
 
-                # Try to import/run each example (or at least validate syntax)
-                for example_file in example_files:
-                    try:
-                        with open(example_file, 'r') as f:
-                            compile(f.read(), example_file, 'exec')
-                        
+                # Validate the syntax of each example; files are parsed in parallel
+                # and reported in listing order
+                with ThreadPoolExecutor() as executor:
+                    errors = list(executor.map(
+                        self._parse_example, (f.path for f in example_files)
+                    ))
+                
+                for example_file, e in zip(example_files, errors):
+                    if e is None:
                         self.print_check(
                             f"Example '{example_file.name}' syntax valid",
                             "PASS"
@@ -601,7 +709,7 @@ class ValidationChecklist:
                             f"Example {example_file.name} syntax",
                             True
                         )
-                    except SyntaxError as e:
+                    else:
                         self.print_check(
                             f"Example '{example_file.name}' syntax valid",
                             "FAIL",
@@ -634,82 +742,139 @@ class ValidationChecklist:
 
         return all_passed
 
+    @staticmethod
+    def _parse_example(path: str) -> Optional[SyntaxError]:
+        """
+        Parse an example script without compiling it to bytecode.
+        
+        Returns:
+            The SyntaxError raised by the parser, or None if the file is valid
+        """
+        with open(path, 'rb') as f:
+            source = f.read()
+        try:
+            ast.parse(source, path, 'exec')
+        except SyntaxError as e:
+            return e
+        return None
+
     # =========================================================================
     # Final Report
     # =========================================================================
 
     def print_summary(self) -> int:
         """Print validation summary and return exit code."""
+        output = self._local.output = []
+        try:
+            return self._print_summary_lines()
+        finally:
+            self._local.output = None
+            self._write_lines(output)
+
+    def _print_summary_lines(self) -> int:
+        """Emit the summary lines through _print and return the exit code."""
         self.print_header("VALIDATION SUMMARY")
 
         total_checks = len(self.passed_checks) + len(self.failed_checks)
         passed_count = len(self.passed_checks)
         failed_count = len(self.failed_checks)
 
-        print(f"\nTotal Checks: {total_checks}")
-        print(f"Passed: {passed_count}")
-        print(f"Failed: {failed_count}")
-        print(f"Success Rate: {(passed_count / total_checks * 100):.1f}%")
+        self._print(f"\nTotal Checks: {total_checks}")
+        self._print(f"Passed: {passed_count}")
+        self._print(f"Failed: {failed_count}")
+        self._print(f"Success Rate: {(passed_count / total_checks * 100):.1f}%")
 
         if self.failed_checks:
-            print("\n" + "=" * 80)
-            print("  FAILED CHECKS:")
-            print("=" * 80)
-            for check in self.failed_checks:
-                print(f"  ✗ {check}")
+            self._print("\n" + "=" * 80)
+            self._print("  FAILED CHECKS:")
+            self._print("=" * 80)
+            for section, check_name in self.failed_checks:
+                self._print(f"  ✗ {section}::{check_name}")
 
         # Detailed results by section
         if self.results:
-            print("\n" + "=" * 80)
-            print("  DETAILED RESULTS BY SECTION:")
-            print("=" * 80)
+            self._print("\n" + "=" * 80)
+            self._print("  DETAILED RESULTS BY SECTION:")
+            self._print("=" * 80)
             
             for section, checks in self.results.items():
-                section_passed = sum(1 for c in checks.values() if c["passed"])
-                section_total = len(checks)
+                section_passed, section_total = self._section_counts[section]
                 
                 status = "✓ PASS" if section_passed == section_total else "✗ FAIL"
-                print(f"\n{status} {section} ({section_passed}/{section_total})")
+                self._print(f"\n{status} {section} ({section_passed}/{section_total})")
                 
                 for check_name, result in checks.items():
                     symbol = "✓" if result["passed"] else "✗"
-                    print(f"  {symbol} {check_name}")
+                    self._print(f"  {symbol} {check_name}")
                     if result["message"]:
-                        print(f"     {result['message']}")
+                        self._print(f"     {result['message']}")
 
-        print("\n" + "=" * 80)
+        self._print("\n" + "=" * 80)
         
         if failed_count == 0:
-            print("  ✓ ALL VALIDATIONS PASSED - READY FOR PUBLIC RELEASE")
-            print("=" * 80)
+            self._print("  ✓ ALL VALIDATIONS PASSED - READY FOR PUBLIC RELEASE")
+            self._print("=" * 80)
             return 0
         else:
-            print(f"  ✗ {failed_count} VALIDATION(S) FAILED - FIXES REQUIRED")
-            print("=" * 80)
+            self._print(f"  ✗ {failed_count} VALIDATION(S) FAILED - FIXES REQUIRED")
+            self._print("=" * 80)
             return 1
 
     def run_all_checks(self) -> int:
         """Run all validation checks."""
-        print("\n")
-        print("╔" + "=" * 78 + "╗")
-        print("║" + " " * 78 + "║")
-        print("║" + "  DECIMAL-PHYSICS-CONTROLLER PRE-DEPLOYMENT VALIDATION".center(78) + "║")
-        print("║" + " " * 78 + "║")
-        print("╚" + "=" * 78 + "╝")
-
-        # Run all sections
-        self.check_environment_and_dependencies()
-        self.check_package_structure()
-        self.check_package_import_and_instantiation()
-        self.check_core_functionality()
-        self.check_license_validation()
-        self.check_readme_validation()
-        self.check_pytest_execution()
-        self.check_example_scripts()
+        self._write_lines([
+            "\n",
+            "╔" + "=" * 78 + "╗",
+            "║" + " " * 78 + "║",
+            "║" + "  DECIMAL-PHYSICS-CONTROLLER PRE-DEPLOYMENT VALIDATION".center(78) + "║",
+            "║" + " " * 78 + "║",
+            "╚" + "=" * 78 + "╝",
+        ])
+
+        # The sections are independent and mostly wait on the filesystem or the
+        # pytest subprocess, so run them in parallel. Section 4 uses the import
+        # made by section 3, so those two share a worker.
+        section_groups = [
+            (self.check_environment_and_dependencies,),
+            (self.check_package_structure,),
+            (self.check_package_import_and_instantiation, self.check_core_functionality),
+            (self.check_license_validation,),
+            (self.check_readme_validation,),
+            (self.check_pytest_execution,),
+            (self.check_example_scripts,),
+        ]
+        
+        with ThreadPoolExecutor(max_workers=len(section_groups)) as executor:
+            futures = [executor.submit(self._run_sections, group) for group in section_groups]
+            
+            # Replay output and results in section order so the report is the
+            # same as a sequential run, one write per section
+            for future in futures:
+                output, records = future.result()
+                self._write_lines(output)
+                for record in records:
+                    self.record_result(*record)
 
         # Print summary and return exit code
         return self.print_summary()
 
+    def _run_sections(self, checks: Tuple[Callable[[], bool], ...]) -> Tuple[List[str], List[tuple]]:
+        """
+        Run validation sections on the current thread, buffering their output.
+        
+        Returns:
+            The printed lines and the recorded results, in order
+        """
+        self._local.output = []
+        self._local.records = []
+        try:
+            for check in checks:
+                check()
+            return self._local.output, self._local.records
+        finally:
+            self._local.output = None
+            self._local.records = None
+
 
 def main() -> int:
     """Main entry point."""